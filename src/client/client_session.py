@@ -71,20 +71,36 @@ class ClientSessionProxy:
                 packet = self.state_queue.get_nowait()
             except Empty:
                 break
+            self._apply_packet(packet)
+
+    def wait_for_state(self, timeout: float) -> Optional[GameState]:
+        """
+        Blocks until a snapshot packet arrives (or `timeout` seconds pass), applies it along
+        with anything queued behind it, and returns the current state. Lets loading threads
+        wait for the first snapshot without a sleep/poll loop.
+        """
+        try:
+            packet = self.state_queue.get(timeout=max(timeout, 0.0))
+        except Empty:
+            return self.state
+        self._apply_packet(packet)
+        self.tick(0.0)
+        return self.state
 
-            try:
-                self.state = self._snapshots.decode(packet)
-            except SnapshotProtocolError as exc:
-                print(f"[ClientSessionProxy] Snapshot protocol error: {exc}")
-                continue
+    def _apply_packet(self, packet) -> None:
+        try:
+            self.state = self._snapshots.decode(packet)
+        except SnapshotProtocolError as exc:
+            print(f"[ClientSessionProxy] Snapshot protocol error: {exc}")
+            return
 
-            try:
-                self.snapshot_ack_queue.put_nowait(self._snapshots.sequence)
-            except Full:
-                pass
+        try:
+            self.snapshot_ack_queue.put_nowait(self._snapshots.sequence)
+        except Full:
+            pass
 
-            self._hydrate_command_sequences()
-            self._capture_system_errors()
+        self._hydrate_command_sequences()
+        self._capture_system_errors()
 
     def _hydrate_command_sequences(self) -> None:
         if self.state is None:
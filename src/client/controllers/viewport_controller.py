@@ -1,6 +1,7 @@
 import arcade
 import polars as pl
-from typing import Optional, Callable, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Callable, Dict, List
 from enum import Enum, auto
 
 from src.client.controllers.camera_controller import CameraController
@@ -113,6 +114,11 @@ class ViewportController:
         }
         self.current_mode_key = "political"
 
+        # Map-mode colours are computed off the draw thread; only the LUT upload stays on it.
+        self._color_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-colors")
+        self._pending_colors: Optional[Future] = None
+        self._pending_highlight: Optional[List[int]] = None  # Applied together with the pending colours
+
     def set_selection_mode(self, mode: SelectionMode):
         self.selection_mode = mode
         self.renderer.clear_highlight()
@@ -139,7 +145,12 @@ class ViewportController:
 
     # --- VISUALIZATION HELPERS ---
 
-    def refresh_map_layer(self):
+    def refresh_map_layer(self, highlight: Optional[List[int]] = None):
+        """
+        Recomputes the active map mode's colours on the worker.
+        A highlight (real region IDs, empty to clear) is held back and applied in the same
+        LUT rebuild as the colours, rather than as a separate selection pass.
+        """
         state = self.net.get_state()
         
         # Safety check if we are in 'terrain' mode or invalid key
@@ -147,7 +158,6 @@ class ViewportController:
             return
 
         active_mode = self.map_modes[self.current_mode_key]
-        color_map = active_mode.calculate_colors(state)
 
         # We rely on set_map_mode to have set the enabled/opacity state correctly,
         # but we re-assert it here just in case.
@@ -155,7 +165,34 @@ class ViewportController:
             enabled=active_mode.overlay_enabled,
             opacity=active_mode.opacity
         )
-        self.renderer.update_overlay(color_map)
+
+        # A newer request supersedes one that has not started yet.
+        if self._pending_colors is not None:
+            self._pending_colors.cancel()
+        self._pending_colors = self._color_worker.submit(active_mode.calculate_colors, state)
+        if highlight is not None:
+            self._pending_highlight = highlight
+
+    def poll_pending_updates(self):
+        """
+        Applies the latest map-mode colours once the worker has produced them.
+        Must be called from the draw thread, since the overlay upload is a GL call.
+        """
+        future = self._pending_colors
+        if future is None or not future.done():
+            return
+        self._pending_colors = None
+
+        try:
+            color_map = future.result()
+        except Exception as e:
+            print(f"[ViewportController] Map mode colouring failed: {e}")
+            return
+        highlight, self._pending_highlight = self._pending_highlight, None
+        if highlight is None:
+            self.renderer.update_overlay(color_map)
+        else:
+            self.renderer.update_overlay(color_map, highlight=highlight)
 
     def refresh_political_layer(self):
         self.set_map_mode("political")
@@ -203,11 +240,12 @@ class ViewportController:
     # --- SELECTION LOGIC ---
     def select_region_by_id(self, region_id: int):
         if region_id is None or region_id <= 0:
-            self.renderer.clear_highlight()
             self.selected_country_tag = None
             self._sync_empire_focus()
             if self.current_mode_key == "empire":
-                self.refresh_map_layer()
+                self.refresh_map_layer(highlight=[])
+            else:
+                self.renderer.clear_highlight()
             self.on_selection_change(None)
             return
         self._apply_selection_logic(region_id)
@@ -236,8 +274,7 @@ class ViewportController:
         self._sync_empire_focus()
 
         if self.current_mode_key == "empire":
-            self.renderer.clear_highlight()
-            self.refresh_map_layer()
+            self.refresh_map_layer(highlight=[])
         else:
             self.renderer.set_highlight(highlight_ids)
         self.on_selection_change(region_id)
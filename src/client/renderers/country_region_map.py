@@ -134,6 +134,9 @@ class CountryRegionMapTextureCache:
         self.rasterizer = rasterizer or CountryRegionMapRasterizer()
         self.max_entries = max(1, int(max_entries))
         self._cache: OrderedDict[tuple[int, int, int, tuple[int, ...]], Optional[CountryMapTexture]] = OrderedDict()
+        # Evicted textures; a new preview of the same size is written into one in place
+        # instead of allocating a new GL texture.
+        self._spare: list[CountryMapTexture] = []
         self._error_printed = False
 
     def get_texture(
@@ -158,7 +161,10 @@ class CountryRegionMapTextureCache:
         self._cache[key] = texture
         self._cache.move_to_end(key)
         while len(self._cache) > self.max_entries:
-            self._cache.popitem(last=False)
+            _, evicted = self._cache.popitem(last=False)
+            if evicted is not None:
+                self._spare.append(evicted)
+        del self._spare[:-self.max_entries]
 
         return texture
 
@@ -166,6 +172,15 @@ class CountryRegionMapTextureCache:
         self._render_imgui_image(texture.gl_id, width, height)
 
     def _upload_to_gpu(self, image: Image.Image) -> Optional[CountryMapTexture]:
+        for index, texture in enumerate(self._spare):
+            if (texture.width, texture.height) == image.size:
+                del self._spare[index]
+                try:
+                    texture.gl_obj.write(image.tobytes())
+                    return texture
+                except Exception:
+                    break  # Fall back to a fresh texture
+
         try:
             window = arcade.get_window()
             ctx = window.ctx
@@ -46,6 +46,8 @@ class FlagRenderer:
         self.flags_dir = ProjectPaths.assets("base") / "flags"
         
         self._cache: Dict[str, Optional[FlagTexture]] = {}
+        # gl_id -> the texture argument imgui.image accepted, so the cast probing runs once per texture
+        self._image_refs: Dict[int, Any] = {}
         
         self._fallback_tag = "XXX"
         self._error_printed = False # To prevent console spam on rendering failures
@@ -59,13 +61,20 @@ class FlagRenderer:
         Public API to draw a flag in the current ImGui window.
         Handles lookup, fallback to emergency texture, and ImGui rendering.
         """
-        texture = self.get_texture(tag)
-        
+        self.draw_texture(self.get_texture(tag), width, height)
+
+    def draw_texture(self, texture: Optional[FlagTexture], width: float, height: float):
+        """Draws an already resolved flag texture (see get_texture) in the current ImGui window."""
         # If even the emergency texture fails, just draw a dummy box to preserve layout
         if not texture or texture.gl_id <= 0:
             imgui.dummy(imgui.ImVec2(width, height))
             return
 
+        image_ref = self._image_refs.get(texture.gl_id)
+        if image_ref is not None:
+            imgui.image(image_ref, imgui.ImVec2(width, height))
+            return
+
         self._render_imgui_image(texture.gl_id, width, height)
 
     def _render_imgui_image(self, gl_id: int, w: float, h: float):
@@ -78,10 +87,12 @@ class FlagRenderer:
         
         # ATTEMPT 1: Strict Binding Cast (ImTextureRef)
         # Some bindings require a specific reference object wrapper.
+        # Whichever form works is remembered in _image_refs and reused by draw_texture.
         try:
             if hasattr(imgui, "ImTextureRef"):
                 tex_ref = imgui.ImTextureRef(gl_id) 
                 imgui.image(tex_ref, size)
+                self._image_refs[gl_id] = tex_ref
                 return
         except Exception:
             pass
@@ -91,6 +102,7 @@ class FlagRenderer:
             if hasattr(imgui, "ImTextureID"):
                 tex_id = imgui.ImTextureID(gl_id)
                 imgui.image(tex_id, size)
+                self._image_refs[gl_id] = tex_id
                 return
         except Exception:
             pass
@@ -99,6 +111,7 @@ class FlagRenderer:
         # Sometimes the bindings are smart enough to take a raw int.
         try:
             imgui.image(gl_id, size)
+            self._image_refs[gl_id] = gl_id
             return
         except TypeError:
             pass
@@ -108,6 +121,7 @@ class FlagRenderer:
         try:
             ptr = ctypes.c_void_p(gl_id)
             imgui.image(ptr, size)
+            self._image_refs[gl_id] = ptr
             return
         except TypeError:
             pass
@@ -185,6 +199,8 @@ class FlagRenderer:
                 flag_path = self.flags_dir / f"{self._fallback_tag}.png"
 
         if not flag_path.exists():
+            # Remember the miss so a missing flag doesn't cost three stat() calls every frame
+            self._cache[tag] = self._emergency_texture
             return self._emergency_texture
 
         try:
@@ -200,4 +216,5 @@ class FlagRenderer:
             return self._emergency_texture
 
     def clear_cache(self):
-        self._cache.clear()
\ No newline at end of file
+        self._cache.clear()
+        self._image_refs.clear()
\ No newline at end of file
@@ -0,0 +1,263 @@
+import ctypes
+from typing import List, Optional
+
+import OpenGL.GL as gl
+from imgui_bundle import imgui
+from imgui_bundle.python_backends.opengl_backend_programmable import ProgrammablePipelineRenderer
+from imgui_bundle.python_backends.opengl_base_backend import get_common_gl_state, restore_common_gl_state
+
+
+class StagedImGuiRenderer(ProgrammablePipelineRenderer):
+    """
+    ImGui backend that streams draw data through a ring of pre-allocated buffer segments.
+
+    The stock backend re-specifies its VBO/IBO with glBufferData once per command list,
+    which lets the driver stall or reallocate whenever the GPU is still reading the
+    previous frame. Here a single vertex buffer and a single index buffer are split into
+    SEGMENTS slices; each frame writes into the next slice (guarded by a fence) and draws
+    with glDrawElementsBaseVertex at that slice's offset.
+
+    When the context offers buffer storage (GL 4.4 or GL_ARB_buffer_storage) the buffers are
+    persistently mapped and the frame data is memcpy'd straight into them; otherwise the same
+    ring is filled with glBufferSubData, which still avoids per-list re-allocation.
+    ImGuiService.STAGED_RENDERER switches back to the stock backend.
+    """
+
+    SEGMENTS = 3
+    INITIAL_SEGMENT_BYTES = 1 << 20
+    FENCE_TIMEOUT_NS = 1_000_000_000
+
+    def __init__(self):
+        self._segment_vtx_bytes = self.INITIAL_SEGMENT_BYTES
+        self._segment_idx_bytes = self.INITIAL_SEGMENT_BYTES
+        self._frame_index = 0
+        self._fences: List[Optional[int]] = [None] * self.SEGMENTS
+        self._vtx_ptr: Optional[int] = None
+        self._idx_ptr: Optional[int] = None
+        self._persistent = False
+        super().__init__()
+
+    # --- Device objects ---
+
+    def _create_device_objects(self):
+        super()._create_device_objects()
+        self._persistent = self._supports_buffer_storage()
+        self._allocate_ring()
+
+    @staticmethod
+    def _supports_buffer_storage() -> bool:
+        """
+        Asks the current context. PyOpenGL resolves GL 4.4 entry points straight from libGL,
+        so bool(gl.glBufferStorage) is True even on drivers that only expose GL 3.3.
+        """
+        version = (int(gl.glGetIntegerv(gl.GL_MAJOR_VERSION)), int(gl.glGetIntegerv(gl.GL_MINOR_VERSION)))
+        if version >= (4, 4):
+            return True
+        count = int(gl.glGetIntegerv(gl.GL_NUM_EXTENSIONS))
+        return any(gl.glGetStringi(gl.GL_EXTENSIONS, i) == b"GL_ARB_buffer_storage" for i in range(count))
+
+    def _invalidate_device_objects(self):
+        self._release_ring()
+        super()._invalidate_device_objects()
+
+    def _allocate_ring(self):
+        """(Re)creates the vertex/index ring buffers and points the VAO at the new VBO."""
+        last_vertex_array = gl.glGetIntegerv(gl.GL_VERTEX_ARRAY_BINDING)
+        last_array_buffer = gl.glGetIntegerv(gl.GL_ARRAY_BUFFER_BINDING)
+
+        # Immutable storage cannot be resized, so growing always means fresh buffer names.
+        gl.glDeleteBuffers(2, [self._vbo_handle, self._elements_handle])
+        self._vbo_handle = gl.glGenBuffers(1)
+        self._elements_handle = gl.glGenBuffers(1)
+
+        gl.glBindVertexArray(self._vao_handle)
+        self._vtx_ptr = self._allocate_buffer(
+            gl.GL_ARRAY_BUFFER, self._vbo_handle, self._segment_vtx_bytes * self.SEGMENTS
+        )
+        self._bind_vertex_layout()
+        # The element binding is VAO state; bind it while our VAO is current.
+        self._idx_ptr = self._allocate_buffer(
+            gl.GL_ELEMENT_ARRAY_BUFFER, self._elements_handle, self._segment_idx_bytes * self.SEGMENTS
+        )
+
+        gl.glBindVertexArray(last_vertex_array)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, last_array_buffer)
+
+    def _allocate_buffer(self, target: int, handle: int, size: int) -> Optional[int]:
+        gl.glBindBuffer(target, handle)
+        if not self._persistent:
+            gl.glBufferData(target, size, None, gl.GL_STREAM_DRAW)
+            return None
+
+        flags = gl.GL_MAP_WRITE_BIT | gl.GL_MAP_PERSISTENT_BIT | gl.GL_MAP_COHERENT_BIT
+        gl.glBufferStorage(target, size, None, flags)
+        return gl.glMapBufferRange(target, 0, size, flags)
+
+    def _bind_vertex_layout(self):
+        """Points the VAO's attributes at the currently bound GL_ARRAY_BUFFER."""
+        stride = imgui.VERTEX_SIZE
+        gl.glVertexAttribPointer(
+            self._attrib_location_position, 2, gl.GL_FLOAT, gl.GL_FALSE,
+            stride, ctypes.c_void_p(imgui.VERTEX_BUFFER_POS_OFFSET),
+        )
+        gl.glVertexAttribPointer(
+            self._attrib_location_uv, 2, gl.GL_FLOAT, gl.GL_FALSE,
+            stride, ctypes.c_void_p(imgui.VERTEX_BUFFER_UV_OFFSET),
+        )
+        gl.glVertexAttribPointer(
+            self._attrib_location_color, 4, gl.GL_UNSIGNED_BYTE, gl.GL_TRUE,
+            stride, ctypes.c_void_p(imgui.VERTEX_BUFFER_COL_OFFSET),
+        )
+
+    def _release_ring(self):
+        self._wait_all_fences()
+        if self._persistent and self._vtx_ptr is not None:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo_handle)
+            gl.glUnmapBuffer(gl.GL_ARRAY_BUFFER)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._elements_handle)
+            gl.glUnmapBuffer(gl.GL_ARRAY_BUFFER)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+        self._vtx_ptr = self._idx_ptr = None
+
+    # --- Fences ---
+
+    def _wait_fence(self, segment: int):
+        fence = self._fences[segment]
+        if fence is None:
+            return
+        # The segment is about to be overwritten, so a timeout is not a reason to go ahead:
+        # keep waiting (the first call already flushed), and drain the queue if the wait fails.
+        flags = gl.GL_SYNC_FLUSH_COMMANDS_BIT
+        while True:
+            result = gl.glClientWaitSync(fence, flags, self.FENCE_TIMEOUT_NS)
+            if result == gl.GL_TIMEOUT_EXPIRED:
+                flags = 0
+                continue
+            if result == gl.GL_WAIT_FAILED:
+                gl.glFinish()
+            break
+        gl.glDeleteSync(fence)
+        self._fences[segment] = None
+
+    def _wait_all_fences(self):
+        for segment in range(self.SEGMENTS):
+            self._wait_fence(segment)
+
+    def _ensure_capacity(self, vtx_bytes: int, idx_bytes: int):
+        if vtx_bytes <= self._segment_vtx_bytes and idx_bytes <= self._segment_idx_bytes:
+            return
+        while self._segment_vtx_bytes < vtx_bytes:
+            self._segment_vtx_bytes *= 2
+        while self._segment_idx_bytes < idx_bytes:
+            self._segment_idx_bytes *= 2
+        self._release_ring()
+        self._allocate_ring()
+
+    # --- Upload ---
+
+    def _write(self, target: int, ptr: Optional[int], offset: int, src_address: int, size: int):
+        if ptr is not None:
+            ctypes.memmove(ptr + offset, src_address, size)
+        else:
+            gl.glBufferSubData(target, offset, size, ctypes.c_void_p(src_address))
+
+    def render(self, draw_data: imgui.ImDrawData) -> None:
+        io = self.io
+
+        display_width, display_height = io.display_size
+        fb_width = int(display_width * io.display_framebuffer_scale[0])
+        fb_height = int(display_height * io.display_framebuffer_scale[1])
+
+        # Honor RendererHasTextures
+        self._update_textures()
+
+        if fb_width == 0 or fb_height == 0:
+            return
+
+        draw_data.scale_clip_rects(io.display_framebuffer_scale)
+
+        vtx_size = imgui.VERTEX_SIZE
+        idx_size = imgui.INDEX_SIZE
+        self._ensure_capacity(draw_data.total_vtx_count * vtx_size, draw_data.total_idx_count * idx_size)
+
+        segment = self._frame_index % self.SEGMENTS
+        self._frame_index += 1
+        self._wait_fence(segment)
+
+        vtx_base = segment * self._segment_vtx_bytes
+        idx_base = segment * self._segment_idx_bytes
+
+        # backup GL state
+        common_gl_state_tuple = get_common_gl_state()
+        last_program = gl.glGetIntegerv(gl.GL_CURRENT_PROGRAM)
+        last_active_texture = gl.glGetIntegerv(gl.GL_ACTIVE_TEXTURE)
+        last_array_buffer = gl.glGetIntegerv(gl.GL_ARRAY_BUFFER_BINDING)
+        last_vertex_array = gl.glGetIntegerv(gl.GL_VERTEX_ARRAY_BINDING)
+
+        gl.glEnable(gl.GL_BLEND)
+        gl.glBlendEquation(gl.GL_FUNC_ADD)
+        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+        gl.glDisable(gl.GL_CULL_FACE)
+        gl.glDisable(gl.GL_DEPTH_TEST)
+        gl.glEnable(gl.GL_SCISSOR_TEST)
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glPolygonMode(gl.GL_FRONT_AND_BACK, gl.GL_FILL)
+
+        gl.glViewport(0, 0, int(fb_width), int(fb_height))
+
+        ortho_projection = (ctypes.c_float * 16)(
+            2.0 / display_width, 0.0, 0.0, 0.0,
+            0.0, 2.0 / -display_height, 0.0, 0.0,
+            0.0, 0.0, -1.0, 0.0,
+            -1.0, 1.0, 0.0, 1.0,
+        )
+
+        gl.glUseProgram(self._shader_handle)
+        gl.glUniform1i(self._attrib_location_tex, 0)
+        gl.glUniformMatrix4fv(self._attrib_proj_mtx, 1, gl.GL_FALSE, ortho_projection)
+        gl.glBindVertexArray(self._vao_handle)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo_handle)
+
+        # 1. Stage every command list into this frame's segment.
+        cmd_lists = draw_data.cmd_lists
+        list_offsets = []
+        vtx_cursor = 0
+        idx_cursor = 0
+        for commands in cmd_lists:
+            vtx_bytes = commands.vtx_buffer.size() * vtx_size
+            idx_bytes = commands.idx_buffer.size() * idx_size
+            self._write(gl.GL_ARRAY_BUFFER, self._vtx_ptr, vtx_base + vtx_cursor,
+                        commands.vtx_buffer.data_address(), vtx_bytes)
+            self._write(gl.GL_ELEMENT_ARRAY_BUFFER, self._idx_ptr, idx_base + idx_cursor,
+                        commands.idx_buffer.data_address(), idx_bytes)
+            list_offsets.append((vtx_cursor, idx_cursor))
+            vtx_cursor += vtx_bytes
+            idx_cursor += idx_bytes
+
+        # 2. Draw straight out of the segment.
+        gltype = gl.GL_UNSIGNED_SHORT if idx_size == 2 else gl.GL_UNSIGNED_INT
+        for commands, (vtx_offset, idx_offset) in zip(cmd_lists, list_offsets):
+            base_vertex = (vtx_base + vtx_offset) // vtx_size
+            for command in commands.cmd_buffer:
+                gl.glBindTexture(gl.GL_TEXTURE_2D, command.tex_ref.get_tex_id())
+
+                x, y, z, w = command.clip_rect
+                gl.glScissor(int(x), int(fb_height - w), int(z - x), int(w - y))
+
+                gl.glDrawElementsBaseVertex(
+                    gl.GL_TRIANGLES,
+                    command.elem_count,
+                    gltype,
+                    ctypes.c_void_p(idx_base + idx_offset + command.idx_offset * idx_size),
+                    base_vertex + command.vtx_offset,
+                )
+
+        self._fences[segment] = gl.glFenceSync(gl.GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+        # restore modified GL state
+        restore_common_gl_state(common_gl_state_tuple)
+
+        gl.glUseProgram(last_program)
+        gl.glActiveTexture(last_active_texture)
+        gl.glBindVertexArray(last_vertex_array)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, last_array_buffer)
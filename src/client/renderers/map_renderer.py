@@ -37,7 +37,6 @@ class MapRenderer(BaseRenderer):
 
         # --- CACHE SERVICE INIT ---
         self.cache_service = CacheService(ProjectPaths.root())
-        self.texture_manager = TextureManager(self.ctx, self.cache_service)
 
         # --- COMPONENTS ---
         # Pass service to components using Dependency Injection (Composition)
@@ -52,7 +51,10 @@ class MapRenderer(BaseRenderer):
 
         # --- GL RESOURCES ---
         self.program: Optional[arcade.gl.Program] = None
+        self.program_terrain: Optional[arcade.gl.Program] = None
         self.sphere: Optional[SphereMesh] = None
+        # Last value sent per program for rarely-changing per-frame uniforms (None = not in shader)
+        self._uniform_cache: Dict[int, Dict[str, Any]] = {}
 
         self._init_resources(terrain_img_path, map_img_path)
         self._init_glsl_globe()
@@ -68,24 +70,26 @@ class MapRenderer(BaseRenderer):
         self.texture_manager.load_terrain_texture(terrain_path)
         self.texture_manager.init_lookup_texture()
 
-    # ... (Rest of the file remains exactly the same: _init_glsl_globe, draw, etc.)
-    # ...
     def _init_glsl_globe(self):
-        """Initialize the globe shader and geometry."""
+        """Initialize the globe shader variants and geometry."""
         shader_source = ShaderRegistry.load_bundle(ShaderRegistry.GLOBE_V, ShaderRegistry.GLOBE_F)
+
+        # Overlay mode only changes on user input, so it is resolved at compile time:
+        # one program per mode instead of a per-fragment branch on a uniform.
         self.program = self.ctx.program(
             vertex_shader=shader_source["vertex_shader"],
             fragment_shader=shader_source["fragment_shader"],
         )
+        self.program_terrain = self.ctx.program(
+            vertex_shader=shader_source["vertex_shader"],
+            fragment_shader=shader_source["fragment_shader"],
+            defines={"OVERLAY_POLITICAL": "0"},
+        )
 
-        self._set_uniform_if_present("u_map_texture", 0)
-        self._set_uniform_if_present("u_lookup_texture", 1)
-        self._set_uniform_if_present("u_terrain_texture", 2)
-
-        self.texture_manager.set_uniforms(self.program)
+        for program in self._programs():
+            self.texture_manager.bind_program(program)
         
         self._set_uniform_if_present("u_selected_id", -1)
-        self._set_uniform_if_present("u_overlay_mode", 1)
         self._set_uniform_if_present("u_opacity", 0.90)
         self._set_uniform_if_present("u_light_dir", (0.4, 0.3, 1.0))
         self._set_uniform_if_present("u_ambient", 0.35)
@@ -94,32 +98,56 @@ class MapRenderer(BaseRenderer):
         self.sphere = SphereMesh(self.ctx, radius=self.globe_radius, seg_u=256, seg_v=128)
         self.sphere.build_geometry(self.ctx, self.program)
 
+    def _programs(self) -> List[arcade.gl.Program]:
+        return [p for p in (self.program, self.program_terrain) if p is not None]
+
     def _set_uniform_if_present(self, name: str, value: Any):
-        super()._set_uniform_if_present(self.program, name, value)
+        for program in self._programs():
+            super()._set_uniform_if_present(program, name, value)
+
+    def _set_uniform_if_changed(self, program: arcade.gl.Program, name: str, value: Any):
+        """Per-frame uniform write that skips unchanged values and uniforms the variant lacks."""
+        cache = self._uniform_cache.setdefault(id(program), {})
+        if name in cache and (cache[name] is None or cache[name] == value):
+            return
+        try:
+            program[name] = value
+        except KeyError:
+            value = None
+        cache[name] = value
 
     def set_overlay_style(self, enabled: bool, opacity: float):
         self._overlay_enabled = enabled
         self._overlay_opacity = opacity
 
-    def update_overlay(self, color_map: Dict[int, Tuple[int, ...]]):
-        self.texture_manager.update_overlay(color_map)
+    def update_overlay(self, color_map: Dict[int, Tuple[int, ...]], highlight: Optional[List[int]] = None):
+        """
+        Applies a new colour map. When the highlight changes with it, pass the real region IDs
+        (empty to clear) so colours and selection land in one LUT rebuild.
+        """
+        if highlight is None:
+            self.texture_manager.update_overlay(color_map)
+        else:
+            self.texture_manager.update_overlay(color_map, self._resolve_highlight(highlight))
 
     def set_highlight(self, real_region_ids: List[int]):
         if not real_region_ids:
             self.clear_highlight()
             return
+        self.texture_manager.update_selection(self._resolve_highlight(real_region_ids))
 
-        valid_dense_ids: List[int] = []
-        for rid in real_region_ids:
-            if rid in self.texture_manager.real_to_dense:
-                valid_dense_ids.append(self.texture_manager.real_to_dense[rid])
+    def _resolve_highlight(self, real_region_ids: List[int]) -> Set[int]:
+        """
+        Sets the single-region highlight uniform state and returns the dense IDs
+        for the multi-region (LUT alpha) highlight.
+        """
+        valid_dense_ids = self.texture_manager.lookup_dense_ids(real_region_ids).tolist() if real_region_ids else []
 
         if len(valid_dense_ids) == 1:
             self.single_select_dense_id = valid_dense_ids[0]
-            self.texture_manager.update_selection(set())
-        else:
-            self.single_select_dense_id = -1
-            self.texture_manager.update_selection(set(valid_dense_ids))
+            return set()
+        self.single_select_dense_id = -1
+        return set(valid_dense_ids)
 
     def clear_highlight(self):
         self.single_select_dense_id = -1
@@ -132,24 +160,24 @@ class MapRenderer(BaseRenderer):
         w, h = self.window.get_size()
         self.camera.update_matrices(w, h)
         
+        program = self.program if self._overlay_enabled else self.program_terrain
+        if program is None:
+            return
+
+        self.texture_manager.pump_uploads()
         self._enable_rendering_state()
-        self.texture_manager.bind_textures(self.program)
+        self.texture_manager.bind_textures()
         
         model, view, proj = self.camera.get_matrices()
-        self.program["u_model"] = model
-        self.program["u_view"] = view
-        self.program["u_projection"] = proj
-        
-        self.program["u_selected_id"] = int(self.single_select_dense_id)
-        
-        camera_pos = self.camera.get_position()
-        self._set_uniform_if_present("u_camera_pos", camera_pos)
+        program["u_model"] = model
+        program["u_view"] = view
+        program["u_projection"] = proj
         
-        mode_int = 1 if self._overlay_enabled else 0
-        self._set_uniform_if_present("u_overlay_mode", mode_int)
-        self._set_uniform_if_present("u_opacity", self._overlay_opacity)
+        self._set_uniform_if_changed(program, "u_selected_id", int(self.single_select_dense_id))
+        self._set_uniform_if_changed(program, "u_camera_pos", self.camera.get_position())
+        self._set_uniform_if_changed(program, "u_opacity", float(self._overlay_opacity))
         
-        self.sphere.geo.render(self.program)
+        self.sphere.geo.render(program)
         self._disable_rendering_state()
 
     def get_region_id_at_screen_pos(self, sx: float, sy: float) -> int:
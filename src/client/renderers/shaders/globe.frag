@@ -1,5 +1,9 @@
 #version 330
 
+// Compile-time variant switch (replaces a per-fragment u_overlay_mode branch).
+// MapRenderer builds this shader twice: 1 = Political overlay, 0 = Terrain only.
+#define OVERLAY_POLITICAL 1
+
 // ==========================================
 // 1. CONFIGURATION & CONSTANTS
 // ==========================================
@@ -36,7 +40,6 @@ uniform sampler2D u_lookup_texture;
 uniform float u_lut_dim;
 uniform vec2  u_texture_size;
 uniform int   u_selected_id;
-uniform int   u_overlay_mode; // 0=Terrain, 1=Political
 uniform float u_opacity;
 
 // Environment
@@ -50,9 +53,10 @@ uniform vec3  u_camera_pos;
 
 // Convert encoded RGB to Integer ID
 // Why: Standard float-to-int casting can be lossy; adding 0.5 ensures stable rounding.
+// The map texture holds the little-endian bytes of the ID, so R is the low byte.
 int decode_id(vec3 rgb) {
     ivec3 c = ivec3(rgb * 255.0 + 0.5);
-    return (c.r << 16) | (c.g << 8) | c.b;
+    return (c.b << 16) | (c.g << 8) | c.r;
 }
 
 // Map ID to LUT UV coordinates
@@ -128,8 +132,9 @@ void main() {
     vec4 overlay_data = get_overlay_data(dense_id);
 
     // D. Political Overlay Logic
-    // Only apply if mode is active AND the region has valid data (alpha > 0)
-    if (u_overlay_mode == 1 && overlay_data.a > C_EPSILON) {
+    // Only compiled into the political variant; applies where the region has valid data (alpha > 0)
+#if OVERLAY_POLITICAL
+    if (overlay_data.a > C_EPSILON) {
         vec3 overlay_color = overlay_data.rgb;
 
         // Border Optimization: 
@@ -146,6 +151,7 @@ void main() {
         // Blend overlay onto terrain
         final_rgb = mix(final_rgb, lit_overlay, overlay_data.a * u_opacity);
     }
+#endif
 
     // E. Post-Processing (Atmosphere)
     final_rgb = apply_atmosphere(final_rgb, n, v_world_pos, u_camera_pos);
@@ -1,16 +1,60 @@
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 import arcade
 
 
+# Trig tables and indices depend only on the segment counts, so meshes rebuilt with
+# the same tessellation (e.g. a renderer re-created between views) reuse them.
+@functools.lru_cache(maxsize=8)
+def _sphere_tables(seg_u: int, seg_v: int) -> tuple[np.ndarray, ...]:
+    """Returns read-only (uu, vv, cos_lat, sin_lat, cos_lon, sin_lon) grids of shape (seg_v+1, seg_u+1)."""
+    u = np.linspace(0.0, 1.0, seg_u + 1, dtype=np.float32)
+    v = np.linspace(0.0, 1.0, seg_v + 1, dtype=np.float32)
+
+    uu, vv = np.meshgrid(u, v, indexing="xy")
+
+    # equirectangular mapping:
+    # lon 0..2pi, lat -pi/2..pi/2
+    lon = uu * np.float32(2.0 * np.pi)
+    lat = (np.float32(0.5) - vv) * np.float32(np.pi)
+
+    tables = (uu, vv, np.cos(lat), np.sin(lat), np.cos(lon), np.sin(lon))
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+@functools.lru_cache(maxsize=8)
+def _sphere_indices(seg_u: int, seg_v: int) -> tuple[bytes, int, int]:
+    """Returns (index bytes, index count, element size) for the quad grid."""
+    # indices: 2 triangles per quad, built for the whole (seg_v, seg_u) grid at once.
+    # The default 257x129 grid fits in uint16, halving the IBO and index fetch bandwidth.
+    w = seg_u + 1
+    index_dtype = np.uint16 if w * (seg_v + 1) <= 0x10000 else np.uint32
+    j, i = np.meshgrid(
+        np.arange(seg_v, dtype=index_dtype),
+        np.arange(seg_u, dtype=index_dtype),
+        indexing="ij",
+    )
+    a = j * w + i
+    b = a + 1
+    c = a + w
+    d = c + 1
+    idx = np.stack([a, c, b, b, c, d], axis=-1).reshape(-1)
+    # bytes are immutable, so the cached copy can be handed to every ctx.buffer call
+    return idx.tobytes(), int(idx.size), idx.itemsize
+
+
 class SphereMesh:
     """
     UV sphere mesh for Arcade/ModernGL.
 
     Creates:
       - VBO: interleaved float32 [pos.xyz, uv.xy, nrm.xyz]
-      - IBO: uint32 indices
+      - IBO: uint16 indices (uint32 once the vertex count exceeds 16-bit range)
       - Geometry: built after you have a Program (for attribute binding)
     """
 
@@ -18,47 +62,30 @@ class SphereMesh:
         # seg_u: longitude slices, seg_v: latitude stacks
         seg_u = max(3, int(seg_u))
         seg_v = max(2, int(seg_v))
+        # float32 scalar keeps the scaling in float32 (no float64 promotion or casts back)
+        radius = np.float32(radius)
 
-        u = np.linspace(0.0, 1.0, seg_u + 1, dtype=np.float32)
-        v = np.linspace(0.0, 1.0, seg_v + 1, dtype=np.float32)
-
-        uu, vv = np.meshgrid(u, v, indexing="xy")
-
-        # equirectangular mapping:
-        # lon 0..2pi, lat -pi/2..pi/2
-        lon = uu * (2.0 * np.pi)
-        lat = (0.5 - vv) * np.pi
-
-        x = np.cos(lat) * np.cos(lon)
-        y = np.sin(lat)
-        z = np.cos(lat) * np.sin(lon)
-
-        pos = np.stack([x, y, z], axis=-1).reshape(-1, 3).astype(np.float32) * float(radius)
-        uv = np.stack([uu, vv], axis=-1).reshape(-1, 2).astype(np.float32)
-
-        # normals for unit sphere, same direction as position
-        nrm = (pos / float(radius)).astype(np.float32)
+        uu, vv, cos_lat, sin_lat, cos_lon, sin_lon = _sphere_tables(seg_u, seg_v)
 
         # interleave: pos(3), uv(2), nrm(3)
-        vtx = np.concatenate([pos, uv, nrm], axis=1).astype(np.float32)
+        # Written straight into one preallocated buffer; no per-attribute temporaries.
+        vtx = np.empty((seg_v + 1, seg_u + 1, 8), dtype=np.float32)
+        np.multiply(cos_lat, cos_lon, out=vtx[..., 0])
+        vtx[..., 1] = sin_lat
+        np.multiply(cos_lat, sin_lon, out=vtx[..., 2])
+        vtx[..., 0:3] *= radius
+        vtx[..., 3] = uu
+        vtx[..., 4] = vv
 
-        # indices: 2 triangles per quad
-        indices: list[int] = []
-        w = seg_u + 1
-        for j in range(seg_v):
-            for i in range(seg_u):
-                a = j * w + i
-                b = a + 1
-                c = a + w
-                d = c + 1
-                indices += [a, c, b, b, c, d]
+        # normals for unit sphere, same direction as position
+        np.divide(vtx[..., 0:3], radius, out=vtx[..., 5:8])
+        vtx = vtx.reshape(-1, 8)
 
-        idx = np.array(indices, dtype=np.uint32)
+        idx, self.index_count, self.index_element_size = _sphere_indices(seg_u, seg_v)
 
         # IMPORTANT: Arcade ctx.buffer is keyword-only (data=...)
-        self.vbo = ctx.buffer(data=vtx.tobytes())
-        self.ibo = ctx.buffer(data=idx.tobytes())
-        self.index_count = int(idx.size)
+        self.vbo = ctx.buffer(data=vtx)
+        self.ibo = ctx.buffer(data=idx)
 
         self.geo: arcade.gl.Geometry | None = None
 
@@ -76,5 +103,6 @@ class SphereMesh:
                 )
             ],
             index_buffer=self.ibo,
+            index_element_size=self.index_element_size,
             mode=ctx.TRIANGLES,
         )
@@ -1,16 +1,168 @@
 import arcade
+import mmap
+import os
+import queue
+import threading
+import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Tuple, Optional, List, Set, Any
 from PIL import Image
 
 from src.core.cache_service import CacheService
 
+# Map textures exceed Pillow's decompression-bomb limit; lifted once here rather than per load.
+Image.MAX_IMAGE_PIXELS = None
+
+try:
+    import pyspng
+except ImportError:
+    pyspng = None
+
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+# Smallest slice of the map worth handing to its own encode thread
+_ENCODE_BAND_PIXELS = 1 << 22
+
+
+def _mean_color(rgba: np.ndarray, step: int = 64) -> Tuple[int, int, int, int]:
+    """Average RGBA of an image from a sparse grid of samples (cheap even on a memory map)."""
+    sample = rgba[::step, ::step].reshape(-1, 4)
+    return tuple(int(c) for c in sample.mean(axis=0).round())
+
+
+def _encode_ids(ids_2d: np.ndarray) -> np.ndarray:
+    """
+    Encodes a 2D array of dense region IDs as an (H, W, 4) uint8 image.
+    The little-endian uint32 bytes already are the texels (R = low byte ... A = 0),
+    so the encode is a single cast and no shift/mask passes are needed.
+    Large maps are cast in row bands on a thread pool; np.copyto releases the GIL,
+    so the (possibly flipped) read and the cast run on every core in one pass.
+    """
+    height, width = ids_2d.shape
+    encoded = np.empty((height, width), dtype="<u4")
+
+    workers = min(os.cpu_count() or 1, max(1, ids_2d.size // _ENCODE_BAND_PIXELS))
+    if workers == 1:
+        np.copyto(encoded, ids_2d, casting="unsafe")
+    else:
+        bounds = np.linspace(0, height, workers + 1, dtype=int)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="map-encode") as pool:
+            bands = [
+                pool.submit(np.copyto, encoded[lo:hi], ids_2d[lo:hi], casting="unsafe")
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+            for band in bands:
+                band.result()
+
+    return encoded.view(np.uint8).reshape((height, width, 4))
+
+
+def _has_upload_layout(arr: Optional[np.ndarray], shape: Tuple[Optional[int], ...]) -> bool:
+    """
+    True if a cached array is already in the layout uploaded to GL (flipped uint8, C order).
+    Anything else is regenerated rather than converted, so warm loads stay a straight mmap upload.
+    """
+    if arr is None or arr.dtype != np.uint8 or arr.ndim != len(shape) or not arr.flags.c_contiguous:
+        return False
+    return all(expected is None or dim == expected for dim, expected in zip(arr.shape, shape))
+
+
+def _upload_view(arr: np.ndarray) -> memoryview:
+    """
+    Zero-copy view for ctx.texture(data=...), which needs a contiguous, writable buffer.
+    Cached arrays are stored flipped and C-contiguous, so the copy is only a safety net.
+    """
+    if not arr.flags.c_contiguous:
+        arr = np.ascontiguousarray(arr)
+    return memoryview(arr)
+
+
+def _decode_rgba(path: Path) -> np.ndarray:
+    """
+    Decodes an image file to an (H, W, 4) uint8 array.
+    libspng / libjpeg-turbo decode straight into an ndarray (and, for JPEG, straight to RGBA)
+    when available; Pillow is the fallback.
+    """
+    suffix = path.suffix.lower()
+
+    if suffix == ".png" and pyspng is not None:
+        # libspng expands RGB / grayscale / palette / 16-bit to RGBA8 inside the decode,
+        # which is ~3x faster than decoding RGB and widening it in NumPy afterwards
+        return pyspng.load(path.read_bytes(), format="RGBA")
+    elif suffix in (".jpg", ".jpeg") and simplejpeg is not None:
+        return simplejpeg.decode_jpeg(path.read_bytes(), colorspace="RGBA", fastdct=True, fastupsample=True)
+
+    img = Image.open(path)
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")  # convert() copies even when the mode already matches
+    w, h = img.size
+    # frombuffer wraps Pillow's bytes directly (np.array(img) would copy them again)
+    return np.frombuffer(img.tobytes(), dtype=np.uint8).reshape((h, w, 4))
+
+class _TileStreamer(threading.Thread):
+    """
+    Copies fixed-size tiles out of a (usually memory-mapped) image on a background thread,
+    so disk reads and page faults overlap with rendering. The GL upload stays on the
+    render thread (see TextureManager.pump_uploads).
+    """
+
+    def __init__(self, image: np.ndarray, tile_size: int, max_pending: int = 8):
+        super().__init__(name="terrain-tiles", daemon=True)
+        self.image = image
+        self.tile_size = tile_size
+        self.tiles: "queue.Queue[Optional[Tuple[int, int, np.ndarray]]]" = queue.Queue(maxsize=max_pending)
+        self._stop_event = threading.Event()
+
+    def tile_origins(self) -> List[Tuple[int, int]]:
+        """Tile (x, y) origins, equator outward: the globe camera mostly looks at mid latitudes."""
+        h, w = self.image.shape[:2]
+        ts = self.tile_size
+        origins = [(x, y) for y in range(0, h, ts) for x in range(0, w, ts)]
+        origins.sort(key=lambda o: abs(o[1] + min(ts, h - o[1]) / 2 - h / 2))
+        return origins
+
+    def run(self) -> None:
+        ts = self.tile_size
+        try:
+            for x, y in self.tile_origins():
+                if self._stop_event.is_set():
+                    return
+                tile = np.ascontiguousarray(self.image[y:y + ts, x:x + ts])
+                self.tiles.put((x, y, tile))
+        except Exception as e:
+            print(f"[TextureManager] Terrain streaming failed: {e}")
+        finally:
+            self.image = None
+            self.tiles.put(None)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        # Unblock a pending put so the thread can observe the stop flag
+        while True:
+            try:
+                self.tiles.get_nowait()
+            except queue.Empty:
+                return
+
+
 class TextureManager:
     """
     Manages loading, caching, and updating of textures for rendering.
     Uses CacheService for I/O operations.
     """
+
+    # Texture units are fixed, so sampler uniforms only need to be set once per program
+    MAP_UNIT = 0
+    LOOKUP_UNIT = 1
+    TERRAIN_UNIT = 2
+
+    TERRAIN_TILE_SIZE = 512
     
     def __init__(self, ctx: arcade.gl.Context, cache_service: CacheService, lut_dim: int = 4096):
         self.ctx = ctx
@@ -21,9 +173,17 @@ class TextureManager:
         self.map_texture: Optional[arcade.gl.Texture] = None
         self.terrain_texture: Optional[arcade.gl.Texture] = None
         self.lookup_texture: Optional[arcade.gl.Texture] = None
+        self._lut_pbo: Optional[arcade.gl.Buffer] = None  # Pixel unpack buffer for LUT streaming
+        self._terrain_streamer: Optional[_TileStreamer] = None
         
         # --- LUT Data (Overlays) ---
-        self.lut_data = np.full((self.lut_dim * self.lut_dim, 4), 0, dtype=np.uint8)
+        # Holds only the texture rows dense IDs can reach (see _fit_lut). lut_data is a view over
+        # a persistent buffer, so uploads slice it directly and never allocate.
+        self._lut_backing: mmap.mmap
+        self.lut_data: np.ndarray
+        self._allocate_lut(self.lut_dim * self.lut_dim)
+        self._lut_rows = np.empty(0, dtype=np.intp)  # Rows written by the active overlay
+        self._dirty_lut_rows: Set[int] = set()  # Texture rows changed since the last upload
         
         # --- Color Mapping State ---
         self._active_color_map: Dict[int, Tuple[int, ...]] = {}
@@ -33,8 +193,9 @@ class TextureManager:
         self.prev_multi_select_dense_ids: Set[int] = set()
         
         # --- Region ID Mappings ---
-        self.real_to_dense: Dict[int, int] = {}
-        self.dense_to_real: List[int] = []
+        # unique_ids from the indexer are sorted, so real -> dense is a binary search over
+        # this array rather than a per-region dict (or a table sized to the RGB-packed ID range).
+        self.dense_to_real = np.empty(0, dtype=np.int64)
 
     def load_map_texture(self, 
         map_path: Path, 
@@ -48,40 +209,19 @@ class TextureManager:
         # If get_indices is slow, this line will block startup every time.
         unique_ids, dense_map = indexer.get_indices(source_path=map_path, map_data_array=packed_map)
         
-        self.dense_to_real = unique_ids
-        self.real_to_dense = {real_id: i for i, real_id in enumerate(unique_ids)}
+        self._set_region_ids(unique_ids)
+        self._fit_lut(len(unique_ids))
         # print(f"[TextureManager] Indexed {len(unique_ids)} unique regions.")
         
-        # 2. Check Visual Cache
-        cache_path = self.cache.get_cache_path(map_path, "_visual.npy")
-        encoded_data = None
-        
-        if self.cache.is_cache_valid(map_path, cache_path):
-            encoded_data = self.cache.load_numpy_array(cache_path)
-
-        # 3. CPU Generation (Fallback)
-        if encoded_data is None:
-            print("[TextureManager] Generating MAP visual texture (CPU)...")
-            dense_map_2d = dense_map.reshape((height, width)).astype(np.uint32)
-            
-            # Use bit shifting to pack ID into RGB
-            r = ((dense_map_2d >> 16) & 0xFF).astype(np.uint8)
-            g = ((dense_map_2d >> 8) & 0xFF).astype(np.uint8)
-            b = (dense_map_2d & 0xFF).astype(np.uint8)
-            
-            encoded_data = np.dstack((r, g, b))
-            encoded_data = np.flipud(encoded_data)
-            
-            # 4. Background Save via Service
-            # Note: We pass a COPY to the thread to avoid race conditions 
-            # if encoded_data is modified later (though unlikely here)
-            self.cache.save_numpy_array(cache_path, encoded_data.copy(), in_background=True)
-
-        # 5. Upload to GPU
+        # 2. Encode (no visual cache: the little-endian ID bytes already are the texels,
+        #    so building the texture is one flipped memcpy, cheaper than reading a cached copy)
+        encoded_data = _encode_ids(dense_map.reshape((height, width))[::-1])
+
+        # 3. Upload to GPU
         self.map_texture = self.ctx.texture(
             (width, height),
-            components=3,
-            data=encoded_data.tobytes(),
+            components=4,
+            data=_upload_view(encoded_data),
             filter=(self.ctx.NEAREST, self.ctx.NEAREST),
         )
         self.map_texture.wrap_x = self.ctx.REPEAT # type: ignore
@@ -92,86 +232,312 @@ class TextureManager:
             raise FileNotFoundError(f"[TextureManager] Terrain path not found: {terrain_path}")
         
         cache_path = self.cache.get_cache_path(terrain_path, ".npy")
+        lz4_path = self.cache.get_cache_path(terrain_path, ".lz4") if self.cache.lz4_available else None
         rgba_array = None
 
-        # 1. Try Loading Cache
-        if self.cache.is_cache_valid(terrain_path, cache_path):
-            rgba_array = self.cache.load_numpy_array(cache_path, mmap_mode='r')
+        # 1. Try Loading Cache (LZ4 frames decode faster than the raw .npy reads from disk)
+        if lz4_path is not None and self.cache.is_cache_valid(terrain_path, lz4_path):
+            rgba_array = self.cache.load_numpy_lz4(lz4_path)
+            if not _has_upload_layout(rgba_array, (None, None, 4)):
+                rgba_array = None
+
+        if rgba_array is None and self.cache.is_cache_valid(terrain_path, cache_path):
+            # Copy-on-write map: pages stream from the OS cache straight into the upload
+            # (arcade needs a writable buffer, which 'r' does not provide)
+            rgba_array = self.cache.load_numpy_array(cache_path, mmap_mode='c')
+            if not _has_upload_layout(rgba_array, (None, None, 4)):
+                rgba_array = None
 
         # 2. Slow Fallback (PNG Decode)
         if rgba_array is None:
             print(f"[TextureManager] Decoding PNG (Slow): {terrain_path.name}")
             try:
-                Image.MAX_IMAGE_PIXELS = None
-                img = Image.open(terrain_path).convert("RGBA")
-                arr = np.array(img, dtype=np.uint8)
-                rgba_array = np.flipud(arr)
+                arr = _decode_rgba(terrain_path)
+                # The flip is made contiguous once, serving both the cache and the upload.
+                rgba_array = np.ascontiguousarray(arr[::-1])
+                del arr
                 
                 # Save cache (Terrain is fast enough to save sync usually, but async is safer)
-                self.cache.save_numpy_array(cache_path, rgba_array, in_background=True)
+                if lz4_path is not None:
+                    self.cache.save_numpy_lz4(lz4_path, rgba_array, in_background=True)
+                else:
+                    self.cache.save_numpy_array(cache_path, rgba_array, in_background=True)
             except Exception as e:
                 raise RuntimeError(f"[TextureManager] Failed to load terrain texture: {e}")
 
-        # 3. Upload to GPU
+        # 3. Allocate on the GPU; pixels arrive tile by tile via pump_uploads()
         h, w, _ = rgba_array.shape
         self.terrain_texture = self.ctx.texture(
             (w, h),
             components=4,
-            data=rgba_array.tobytes(),
             filter=(self.ctx.LINEAR, self.ctx.LINEAR),
         )
         self.terrain_texture.wrap_x = self.ctx.REPEAT # type: ignore
         self.terrain_texture.wrap_y = self.ctx.CLAMP_TO_EDGE # type: ignore
 
+        # A fresh texture holds undefined memory until its tiles land; clear it on the GPU to the
+        # terrain's average colour so the first frames show a flat tone instead of garbage.
+        fill = self.ctx.framebuffer(color_attachments=[self.terrain_texture])
+        fill.clear(color=_mean_color(rgba_array))
+        del fill
+
+        self._stop_terrain_stream()
+        self._terrain_streamer = _TileStreamer(rgba_array, self.TERRAIN_TILE_SIZE)
+        self._terrain_streamer.start()
+
+    def pump_uploads(self, budget_ms: float = 4.0) -> None:
+        """
+        Uploads streamed terrain tiles until the frame budget is spent (at least one tile).
+        Called once per frame from the render thread.
+        """
+        streamer = self._terrain_streamer
+        if streamer is None:
+            return
+
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while True:
+            try:
+                item = streamer.tiles.get_nowait()
+            except queue.Empty:
+                return
+            if not self._upload_tile(item) or time.perf_counter() >= deadline:
+                return
+
+    def finish_uploads(self) -> None:
+        """
+        Blocks until the whole terrain is on the GPU. Nothing in the client needs this (the
+        texture is pre-filled and pump_uploads streams the rest); tests and tools use it to
+        read back the complete texture.
+        """
+        while self._terrain_streamer is not None:
+            if not self._upload_tile(self._terrain_streamer.tiles.get()):
+                return
+
+    def _upload_tile(self, item: Optional[Tuple[int, int, np.ndarray]]) -> bool:
+        """Writes one streamed tile; returns False once the stream is exhausted."""
+        if item is None:
+            self._terrain_streamer = None
+            return False
+        x, y, tile = item
+        th, tw = tile.shape[:2]
+        self.terrain_texture.write(tile, viewport=(x, y, tw, th))
+        return True
+
+    def _stop_terrain_stream(self) -> None:
+        if self._terrain_streamer is not None:
+            self._terrain_streamer.stop()
+            self._terrain_streamer = None
+
     def init_lookup_texture(self) -> None:
+        # The shader addresses a lut_dim x lut_dim square, but only the rows mirrored in lut_data
+        # can be sampled, so those are the only ones uploaded.
         self.lookup_texture = self.ctx.texture(
             (self.lut_dim, self.lut_dim),
             components=4,
             filter=(self.ctx.NEAREST, self.ctx.NEAREST),
         )
-        self.lookup_texture.write(self.lut_data.tobytes()) # type: ignore
+        self.lookup_texture.write(memoryview(self.lut_data), viewport=(0, 0, self.lut_dim, self._lut_height()))
+        self._dirty_lut_rows.clear()
+        self._lut_pbo = self.ctx.buffer(reserve=self.lut_dim * 4, usage="stream")
 
-    def update_overlay(self, color_map: Dict[int, Tuple[int, ...]]) -> None:
+    def update_overlay(
+        self,
+        color_map: Dict[int, Tuple[int, ...]],
+        multi_select_dense_ids: Optional[Set[int]] = None,
+    ) -> None:
+        """
+        Rebuilds the LUT for a new colour map. Passing the selection as well folds its alpha
+        into the same scatter, instead of a second update_selection pass over the rows.
+        """
         self._active_color_map = color_map
+        if multi_select_dense_ids is not None:
+            self.prev_multi_select_dense_ids = self.multi_select_dense_ids
+            self.multi_select_dense_ids = set(multi_select_dense_ids)
         self._rebuild_lut_array()
-        if self.lookup_texture:
-            self.lookup_texture.write(self.lut_data.tobytes())
 
     def update_selection(self, multi_select_dense_ids: Set[int]) -> None:
         self.prev_multi_select_dense_ids = self.multi_select_dense_ids.copy()
         self.multi_select_dense_ids = multi_select_dense_ids
         self._update_selection_texture()
 
-    def bind_textures(self, program: arcade.gl.Program) -> None:
+    def bind_program(self, program: arcade.gl.Program) -> None:
+        """Points the program's samplers at the fixed texture units; done once, not per frame."""
+        uniforms = (
+            ("u_map_texture", self.MAP_UNIT),
+            ("u_lookup_texture", self.LOOKUP_UNIT),
+            ("u_terrain_texture", self.TERRAIN_UNIT),
+            ("u_lut_dim", float(self.lut_dim)),
+        )
+        for name, value in uniforms:
+            try:
+                program[name] = value
+            except KeyError:
+                pass  # Optimized out of this shader variant
+
+    def bind_textures(self) -> None:
+        # Overlay and selection changes made since the last frame go up in one pass
+        self.flush_lut()
         if self.map_texture:
-            self.map_texture.use(0)
-            program["u_map_texture"] = 0
+            self.map_texture.use(self.MAP_UNIT)
         if self.lookup_texture:
-            self.lookup_texture.use(1)
-            program["u_lookup_texture"] = 1
+            self.lookup_texture.use(self.LOOKUP_UNIT)
         if self.terrain_texture:
-            self.terrain_texture.use(2)
-            program["u_terrain_texture"] = 2
+            self.terrain_texture.use(self.TERRAIN_UNIT)
+
+    def _set_region_ids(self, unique_ids: np.ndarray) -> None:
+        """Stores the dense <-> real region ID mappings (unique_ids is sorted by np.unique)."""
+        self.dense_to_real = np.asarray(unique_ids, dtype=np.int64)
+
+    def lookup_dense_ids(self, real_ids: np.ndarray) -> np.ndarray:
+        """Dense IDs of the known regions in real_ids (input order kept, unknown IDs dropped)."""
+        dense_ids, found = self._dense_ids_for(np.asarray(real_ids, dtype=np.int64))
+        return dense_ids[found]
+
+    def _fit_lut(self, region_count: int) -> None:
+        """
+        Sizes the LUT to the smallest power-of-two square holding every dense ID.
+        The shader unpacks IDs with u_lut_dim, so only the CPU/GPU allocations change.
+        The CPU mirror keeps just the rows up to the last dense ID.
+        """
+        lut_dim = 1
+        while lut_dim * lut_dim < region_count:
+            lut_dim *= 2
+        rows = max(1, -(-region_count // lut_dim))
+        if lut_dim == self.lut_dim and rows == self._lut_height():
+            return
+
+        self.lut_dim = lut_dim
+        self._allocate_lut(rows * lut_dim)
+        self._lut_rows = np.empty(0, dtype=np.intp)
+        self._rebuild_lut_array()
+        self._dirty_lut_rows.clear()
+
+        if self.lookup_texture:
+            self.lookup_texture.release()
+            self.init_lookup_texture()
+
+    def _dense_ids_for(self, real_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized real -> dense lookup.
+        Returns (dense_ids, found_mask); binary search over the sorted real IDs
+        avoids a lookup table sized to the largest (RGB-packed) real ID.
+        """
+        keys = self.dense_to_real
+        if keys.size == 0:
+            return np.zeros(len(real_ids), dtype=np.intp), np.zeros(len(real_ids), dtype=bool)
+
+        dense_ids = np.minimum(np.searchsorted(keys, real_ids), keys.size - 1)
+        return dense_ids, keys[dense_ids] == real_ids
+
+    @staticmethod
+    def _rgba_array(colors: List[Tuple[int, ...]]) -> np.ndarray:
+        """Converts RGB/RGBA tuples to an (N, 4) uint8 array; RGB entries default to alpha 200."""
+        widths = set(map(len, colors))
+        if len(widths) == 1:
+            # Uniform tuples stream through fromiter, ~3x faster than np.array on a list of tuples
+            width = widths.pop()
+            arr = np.fromiter(chain.from_iterable(colors), dtype=np.uint8, count=width * len(colors))
+            arr = arr.reshape(len(colors), width)
+        else:
+            # Mixed RGB and RGBA tuples cannot form a rectangular array directly
+            arr = np.array([c[:4] if len(c) > 3 else (c[0], c[1], c[2], 200) for c in colors], dtype=np.uint8)
+
+        if arr.shape[1] > 3:
+            return arr[:, :4]
+
+        rgba = np.full((len(arr), 4), 200, dtype=np.uint8)
+        rgba[:, :3] = arr
+        return rgba
+
+    def _allocate_lut(self, texel_count: int) -> None:
+        """
+        Backs lut_data with an anonymous mapping: zeroed pages are only committed when written,
+        and the buffer lives as long as the LUT size does.
+        """
+        self._lut_backing = mmap.mmap(-1, texel_count * 4)
+        self.lut_data = np.frombuffer(self._lut_backing, dtype=np.uint8).reshape((texel_count, 4))
+
+    def _lut_height(self) -> int:
+        """Number of LUT texture rows mirrored in lut_data."""
+        return len(self.lut_data) // self.lut_dim
 
-    def set_uniforms(self, program: arcade.gl.Program) -> None:
-        program["u_lut_dim"] = float(self.lut_dim)
+    def _mark_lut_dirty(self, dense_ids: np.ndarray) -> None:
+        if dense_ids.size:
+            self._dirty_lut_rows.update((np.unique(dense_ids) // self.lut_dim).tolist())
+
+    def flush_lut(self) -> None:
+        """
+        Uploads the LUT rows changed since the last flush as contiguous full-width bands.
+        Updates only mark rows dirty, so several of them in one frame share a single upload.
+        """
+        if not self.lookup_texture or not self._dirty_lut_rows:
+            return
+
+        rows = np.array(sorted(self._dirty_lut_rows))
+        self._dirty_lut_rows.clear()
+
+        backing = memoryview(self._lut_backing)
+        row_bytes = self.lut_dim * 4
+        for band in np.split(rows, np.flatnonzero(np.diff(rows) != 1) + 1):
+            first, last = int(band[0]), int(band[-1]) + 1
+            viewport = (0, first, self.lut_dim, last - first)
+            # Whole rows are contiguous in the backing buffer, so the band is uploaded without a copy
+            data = backing[first * row_bytes:last * row_bytes]
+            if self._lut_pbo is None:
+                self.lookup_texture.write(data, viewport=viewport)
+            else:
+                self.lookup_texture.write(self._stage_in_pbo(data), viewport=viewport)
+
+    def _stage_in_pbo(self, data: memoryview) -> arcade.gl.Buffer:
+        """
+        Copies data into the LUT pixel buffer so the texture update is sourced from GPU memory.
+        The buffer is orphaned first, so the driver never waits on a draw still reading the last update.
+        """
+        pbo = self._lut_pbo
+        pbo.orphan(size=max(pbo.size, data.nbytes))
+        pbo.write(data)
+        return pbo
 
     def _rebuild_lut_array(self) -> None:
-        self.lut_data.fill(0)
-        for real_id, color in self._active_color_map.items():
-            if real_id in self.real_to_dense:
-                dense_id = self.real_to_dense[real_id]
-                if 0 < dense_id < len(self.lut_data):
-                    base_alpha = color[3] if len(color) > 3 else 200
-                    alpha = 255 if dense_id in self.multi_select_dense_ids else base_alpha
-                    self.lut_data[dense_id] = [color[0], color[1], color[2], alpha]
+        # Only the rows written by the previous overlay can be non-zero
+        # Each RGBA texel is addressed as one uint32 so rows are cleared/written with single stores
+        lut_texels = self.lut_data.view(np.uint32).reshape(-1)
+        self._mark_lut_dirty(self._lut_rows)
+        lut_texels[self._lut_rows] = 0
+        self._lut_rows = np.empty(0, dtype=np.intp)
+
+        color_map = self._active_color_map
+        if not color_map:
+            return
+
+        real_ids = np.fromiter(color_map.keys(), dtype=np.int64, count=len(color_map))
+        rgba = self._rgba_array(list(color_map.values()))
+
+        # Unknown IDs are routed to the reserved background row 0 and the write is undone below,
+        # which keeps the scatter branchless instead of compacting with a validity mask.
+        dense_ids, found = self._dense_ids_for(real_ids)
+        dense_ids = np.where(found, dense_ids, 0)
+        np.clip(dense_ids, 0, len(self.lut_data) - 1, out=dense_ids)
+
+        if self.multi_select_dense_ids:
+            selected = np.fromiter(self.multi_select_dense_ids, dtype=np.intp, count=len(self.multi_select_dense_ids))
+            rgba[np.isin(dense_ids, selected), 3] = 255
+
+        # Selection alpha is already folded in, so this one scatter is the final LUT state
+        lut_texels[dense_ids] = np.ascontiguousarray(rgba).view(np.uint32).reshape(-1)
+        lut_texels[0] = 0
+        self._lut_rows = dense_ids
+        self._mark_lut_dirty(dense_ids)
 
     def _update_selection_texture(self) -> None:
-        for idx in self.prev_multi_select_dense_ids:
-            if 0 < idx < len(self.lut_data) and self.lut_data[idx, 3] > 0:
-                self.lut_data[idx, 3] = 200
-        for idx in self.multi_select_dense_ids:
-            if 0 < idx < len(self.lut_data) and self.lut_data[idx, 3] > 0:
-                self.lut_data[idx, 3] = 255
-        if self.lookup_texture:
-            self.lookup_texture.write(self.lut_data.tobytes())
+        # Only regions entering or leaving the selection change; those in both keep alpha 255
+        current, previous = self.multi_select_dense_ids, self.prev_multi_select_dense_ids
+        alpha_channel = self.lut_data[:, 3]
+        for dense_ids, alpha in ((previous - current, 200), (current - previous, 255)):
+            if not dense_ids:
+                continue
+            idx = np.fromiter(dense_ids, dtype=np.intp, count=len(dense_ids))
+            idx = idx[(idx > 0) & (idx < len(alpha_channel))]
+            idx = idx[alpha_channel[idx] > 0]  # Only regions painted by the overlay
+            alpha_channel[idx] = alpha
+            self._mark_lut_dirty(idx)
@@ -2,10 +2,19 @@ import arcade
 from pathlib import Path
 from typing import Optional
 from imgui_bundle import imgui
-from imgui_bundle.python_backends.opengl_backend_programmable import ProgrammablePipelineRenderer as OpenGL3Backend
+from imgui_bundle.python_backends.opengl_backend_programmable import ProgrammablePipelineRenderer
 
+from src.client.renderers.imgui_renderer import StagedImGuiRenderer
 from src.client.ui.core.font_loader import FontLoader
 
+# (ImGui modifier key, Arcade modifier bit) pairs, resolved once instead of per input event
+_MODIFIER_KEYS = (
+    (imgui.Key.mod_ctrl, arcade.key.MOD_CTRL),
+    (imgui.Key.mod_shift, arcade.key.MOD_SHIFT),
+    (imgui.Key.mod_alt, arcade.key.MOD_ALT),
+    (imgui.Key.mod_super, arcade.key.MOD_COMMAND),
+)
+
 class ImGuiService:
     """
     Manages the integration between Arcade (Pyglet) and Dear ImGui.
@@ -20,6 +29,13 @@ class ImGuiService:
         3. Reporting whether ImGui has 'captured' an input event to prevent fall-through.
     """
 
+    # Built once per process; the list mirrors the dict indexed by Arcade key code
+    _KEY_MAP: Optional[dict[int, imgui.Key]] = None
+    _KEY_LIST: list[Optional[imgui.Key]] = []
+
+    # False falls back to imgui_bundle's stock ProgrammablePipelineRenderer
+    STAGED_RENDERER = True
+
     def __init__(self, window: arcade.Window, font_path: Optional[Path] = None):
         self.window = window
         self.window.switch_to()
@@ -52,11 +68,17 @@ class ImGuiService:
             style = imgui.get_style()
             style.font_scale_main = 1.0 / pixel_ratio
 
-        # Initialize the programmable pipeline renderer
-        self.renderer = OpenGL3Backend()
+        # Initialize the programmable pipeline renderer (ring-buffered draw data uploads)
+        self.renderer = StagedImGuiRenderer() if self.STAGED_RENDERER else ProgrammablePipelineRenderer()
 
         # Input mapping cache
-        self.key_map = self._create_key_map()
+        if ImGuiService._KEY_MAP is None:
+            ImGuiService._KEY_MAP = self._create_key_map()
+            key_list: list[Optional[imgui.Key]] = [None] * (max(ImGuiService._KEY_MAP) + 1)
+            for arcade_key, imgui_key in ImGuiService._KEY_MAP.items():
+                key_list[arcade_key] = imgui_key
+            ImGuiService._KEY_LIST = key_list
+        self.key_map = ImGuiService._KEY_MAP
         
         self._frame_started = False
         self._current_delta_time = 1.0 / 60.0
@@ -174,7 +196,7 @@ class ImGuiService:
     def on_key_press(self, key: int, modifiers: int) -> bool:
         self._update_modifiers(modifiers)
         
-        imgui_key = self.key_map.get(key)
+        imgui_key = self._lookup_key(key)
         if imgui_key:
             self.io.add_key_event(imgui_key, True)
             
@@ -185,7 +207,7 @@ class ImGuiService:
     def on_key_release(self, key: int, modifiers: int) -> bool:
         self._update_modifiers(modifiers)
         
-        imgui_key = self.key_map.get(key)
+        imgui_key = self._lookup_key(key)
         if imgui_key:
             self.io.add_key_event(imgui_key, False)
             
@@ -201,10 +223,14 @@ class ImGuiService:
 
     def _update_modifiers(self, modifiers: int):
         """Syncs key modifiers (Ctrl, Alt, Shift) with ImGui state."""
-        self.io.add_key_event(imgui.Key.mod_ctrl, (modifiers & arcade.key.MOD_CTRL) != 0)
-        self.io.add_key_event(imgui.Key.mod_shift, (modifiers & arcade.key.MOD_SHIFT) != 0)
-        self.io.add_key_event(imgui.Key.mod_alt, (modifiers & arcade.key.MOD_ALT) != 0)
-        self.io.add_key_event(imgui.Key.mod_super, (modifiers & arcade.key.MOD_COMMAND) != 0)
+        add_key_event = self.io.add_key_event
+        for imgui_key, mask in _MODIFIER_KEYS:
+            add_key_event(imgui_key, (modifiers & mask) != 0)
+
+    def _lookup_key(self, key: int) -> Optional[imgui.Key]:
+        """Arcade key code -> ImGui key via a plain list index (no hashing)."""
+        key_list = self._KEY_LIST
+        return key_list[key] if 0 <= key < len(key_list) else None
 
     def _map_mouse_button(self, button: int) -> int:
         if button == arcade.MOUSE_BUTTON_LEFT: return 0
@@ -212,7 +238,8 @@ class ImGuiService:
         if button == arcade.MOUSE_BUTTON_MIDDLE: return 2
         return -1
 
-    def _create_key_map(self) -> dict[int, imgui.Key]:
+    @staticmethod
+    def _create_key_map() -> dict[int, imgui.Key]:
         """Maps Arcade key constants to ImGui Key constants."""
         return {
             arcade.key.ESCAPE: imgui.Key.escape,
@@ -10,34 +10,48 @@ class NavigationService:
     def __init__(self, window: arcade.Window):
         self.window = window
 
+        # Views are imported once here rather than inside every show_* call, so a
+        # navigation is a plain attribute read and the first switch doesn't pay for
+        # compiling the view modules. Importing this module stays cheap.
+        from src.client.views.main_menu_view import MainMenuView
+        from src.client.views.loading_view import LoadingView
+        from src.client.views.new_game_view import NewGameView
+        from src.client.views.load_game_view import LoadGameView
+        from src.client.views.game_view import GameView
+        from src.client.views.editor_view import EditorView
+        from src.client.tasks.editor_loading_task import EditorLoadingTask
+
+        self._MainMenuView = MainMenuView
+        self._LoadingView = LoadingView
+        self._NewGameView = NewGameView
+        self._LoadGameView = LoadGameView
+        self._GameView = GameView
+        self._EditorView = EditorView
+        self._EditorLoadingTask = EditorLoadingTask
+
     # --- MAIN MENU & INFRASTRUCTURE ---
 
     def show_main_menu(self, session: "SessionPort", config: "GameConfig"):
-        from src.client.views.main_menu_view import MainMenuView
         print("[Nav] Switching to Main Menu")
-        self.window.show_view(MainMenuView(session, config))
+        self.window.show_view(self._MainMenuView(session, config))
 
     def show_loading(self, task, on_success, on_failure=None):
-        from src.client.views.loading_view import LoadingView
         print("[Nav] Switching to Loading Screen")
-        self.window.show_view(LoadingView(task, on_success, on_failure))
+        self.window.show_view(self._LoadingView(task, on_success, on_failure))
 
     # --- GAMEPLAY FLOW ---
 
     def show_new_game_screen(self, session: "SessionPort", config: "GameConfig"):
-        from src.client.views.new_game_view import NewGameView
         print("[Nav] Switching to New Game Selection")
-        self.window.show_view(NewGameView(session, config))
+        self.window.show_view(self._NewGameView(session, config))
 
     def show_load_game_screen(self, config: "GameConfig"):
-        from src.client.views.load_game_view import LoadGameView
         print("[Nav] Switching to Load Game Screen")
-        self.window.show_view(LoadGameView(config))
+        self.window.show_view(self._LoadGameView(config))
 
     def show_game_view(self, session: "SessionPort", config: "GameConfig", player_tag: str, initial_pos=None):
-        from src.client.views.game_view import GameView
         print(f"[Nav] Starting Game as {player_tag}")
-        self.window.show_view(GameView(session, config, player_tag, initial_pos))
+        self.window.show_view(self._GameView(session, config, player_tag, initial_pos))
 
     # --- TOOLS ---
 
@@ -45,15 +59,14 @@ class NavigationService:
         """
         Handles the complex sequence of Loading Task -> Editor View
         """
-        from src.client.tasks.editor_loading_task import EditorLoadingTask
-        from src.client.views.editor_view import EditorView
-        
+        editor_view_cls = self._EditorView
+
         # 1. Create Task
-        task = EditorLoadingTask(session, config)
+        task = self._EditorLoadingTask(session, config)
         
         # 2. Define what happens when loading finishes
         def on_editor_ready(context: "EditorContext"):
-            return EditorView(context, config)
+            return editor_view_cls(context, config)
 
         # 3. Transition to Loading View
-        self.show_loading(task, on_success=on_editor_ready)
\ No newline at end of file
+        self.show_loading(task, on_success=on_editor_ready)
@@ -1,9 +1,20 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import Tuple
 
 # Absolute path to the directory containing this file
 ROOT = Path(__file__).parent
 
 
+@lru_cache(maxsize=32)
+def _read_sources(vert_path: str, frag_path: str, vert_mtime_ns: int, frag_mtime_ns: int) -> Tuple[str, str]:
+    # The mtimes are only part of the key: editing a shader on disk misses the cache.
+    return (
+        Path(vert_path).read_bytes().decode("utf-8"),
+        Path(frag_path).read_bytes().decode("utf-8"),
+    )
+
+
 class ShaderRegistry:
     """Centralized paths for all GLSL source files."""
 
@@ -15,8 +26,19 @@ class ShaderRegistry:
 
     @classmethod
     def load_bundle(cls, vert_path: Path, frag_path: Path) -> dict:
-        """Helper to read shader files into strings for Arcade."""
+        """
+        Helper to read shader files into strings for Arcade.
+        Sources are cached per (path, mtime), so rebuilding a pipeline only stats the files.
+        """
+        vert_source, frag_source = _read_sources(
+            str(vert_path), str(frag_path), vert_path.stat().st_mtime_ns, frag_path.stat().st_mtime_ns
+        )
         return {
-            "vertex_shader": vert_path.read_text(),
-            "fragment_shader": frag_path.read_text()
-        }
\ No newline at end of file
+            "vertex_shader": vert_source,
+            "fragment_shader": frag_source
+        }
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drops cached sources (e.g. for a dev hot-reload on filesystems with coarse mtimes)."""
+        _read_sources.cache_clear()
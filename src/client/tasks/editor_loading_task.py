@@ -1,10 +1,10 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from src.shared.protocols import SessionPort
 from src.shared.config import GameConfig
 from src.core.paths import ProjectPaths
-# UPDATED: Import Core Data class instead of Shared Atlas
+from src.core.cache_service import CacheService
 from src.core.map_data import RegionMapData
 from src.client.services.network_client_service import NetworkClient
 
@@ -46,27 +46,28 @@ class EditorLoadingTask:
         self.progress = 0.1
         
         map_path = self._resolve_map_path()
-        terrain_path = self._resolve_terrain_path()
-        
-        # Brief sleep ensures the UI thread has a chance to render the text update
-        # before the heavy CPU blocking operation starts.
-        time.sleep(0.1) 
 
         # 2. Load Region Data (Heavy CPU Work)
         self.status_text = "Processing Region Data (CV2)..."
         self.progress = 0.3
-        
+
         # UPDATED: We use the Core class. 
         # This is safe to run in a thread because it touches no OpenGL context.
-        # It just does math on pixels.
-        map_data = RegionMapData(str(map_path))
-        
-        # 3. Initialize Network
-        self.status_text = "Connecting to Session..."
+        # It just does math on pixels. Repeat launches map the packed IDs from the cache instead.
+        # The decode/hash runs in C with the GIL released, so the remaining setup overlaps it,
+        # and the UI keeps rendering this status text (no sleep needed to let it catch up).
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="editor-map") as pool:
+            map_future = pool.submit(RegionMapData.load_cached, map_path, CacheService(ProjectPaths.root()))
+
+            terrain_path = self._resolve_terrain_path()
+
+            # 3. Initialize Network (NetworkClient only wraps the session; no GL / main-thread state)
+            net_client = NetworkClient(self.session)
+
+            map_data, _ = map_future.result()
+
         self.progress = 0.8
         
-        net_client = NetworkClient(self.session)
-        
         # 4. Finalize
         self.status_text = "Finalizing..."
         self.progress = 1.0
@@ -81,16 +82,20 @@ class EditorLoadingTask:
     def _resolve_map_path(self) -> Path:
         """
         Finds the technical region map (defined by specific RGB colors).
+        Found paths are remembered for the session; repeat editor launches skip the probing.
         """
+        return self.config.cached_path("editor.regions", self._find_map_path)
+
+    def _find_map_path(self) -> Path:
         # Try Data Dirs first (User modded content)
         for data_dir in self.config.get_data_dirs():
             candidate = data_dir / "regions" / "regions.png"
-            if candidate.exists():
+            if candidate.is_file():
                 return candidate
         
         # Fallback to internal assets (Core game content)
         candidate = self.config.get_asset_path("map/regions.png")
-        if candidate and candidate.exists():
+        if candidate and candidate.is_file():
             return candidate
             
         # Fallback to root (Critical error usually, but we return a path to fail gracefully later)
@@ -101,9 +106,12 @@ class EditorLoadingTask:
         Finds the artistic terrain background.
         Convention: It lives in the same folder as regions.png usually.
         """
+        return self.config.cached_path("editor.terrain", self._find_terrain_path)
+
+    def _find_terrain_path(self) -> Path:
         # Check standard location in assets
         candidate = self.config.get_asset_path("map/terrain.png")
-        if candidate and candidate.exists():
+        if candidate and candidate.is_file():
             return candidate
 
         # Return a non-existent path if not found; the renderer handles this gracefully.
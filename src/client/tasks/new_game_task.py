@@ -64,12 +64,14 @@ class NewGameTask:
         self.status_text = "Synchronizing game state..."
         self.progress = 0.8
         
-        start_time = time.perf_counter()
+        # Block on the state queue instead of sleep-polling, so the first snapshot is
+        # picked up as soon as the server publishes it.
+        deadline = time.perf_counter() + 5.0
         while new_session.get_state_snapshot() is None:
-            new_session.tick(0.0)
-            if time.perf_counter() - start_time > 5.0:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0.0:
                 raise TimeoutError("Timed out waiting for initial game state.")
-            time.sleep(0.05)
+            new_session.wait_for_state(remaining)
             
         state = new_session.get_state_snapshot()
         start_pos = None
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import polars as pl
 from imgui_bundle import imgui, icons_fontawesome_6
 
 from src.client.ui.core.composer import UIComposer
@@ -6,12 +8,38 @@ from src.client.ui.core.theme import GAMETHEME
 from src.client.renderers.flag_renderer import FlagRenderer
 from src.shared.actions import ActionSetGameSpeed, ActionSetPaused
 
+# Icon glyphs drawn every frame, bound once instead of looked up through the module
+_ICON_CLOCK = icons_fontawesome_6.ICON_FA_CLOCK
+_ICON_BRAIN = icons_fontawesome_6.ICON_FA_BRAIN
+_ICON_CHART = icons_fontawesome_6.ICON_FA_CHART_LINE
+_ICON_MAIL = icons_fontawesome_6.ICON_FA_ENVELOPE
+_ICON_NEWS = icons_fontawesome_6.ICON_FA_NEWSPAPER
+
 class CentralBar:
     """
     HUD component displayed at the bottom of the screen.
     Handles country info, time controls, quick actions, and news ticker.
     Refactored to use UIComposer and modular rendering methods.
     """
+    # (speed level, button label) for the time controls
+    _SPEED_LABELS = ((1, "1"), (2, "2"), (3, "3"), (4, "4"), (5, "5"))
+
+    # Max distinct (text, font size) measurements kept by _text_size
+    _TEXT_SIZE_CACHE_LIMIT = 64
+
+    # (icon, callback attribute, tooltip template formatted with the HUD summary on hover)
+    _QUICK_ACTIONS = (
+        (_ICON_BRAIN, "_open_objectives_cb", "Objectives ({0.active_objectives})"),
+        (_ICON_CHART, "_open_statistics_cb", "Statistics"),
+        (_ICON_MAIL, "_open_mail_cb", "Messages ({0.unread_messages} unread)"),
+    )
+    _QUICK_ACTION_SPACING = 10.0
+
+    _WINDOW_FLAGS = (imgui.WindowFlags_.no_decoration | 
+                     imgui.WindowFlags_.no_move | 
+                     imgui.WindowFlags_.no_scroll_with_mouse |
+                     imgui.WindowFlags_.no_background)
+
     def __init__(
         self,
         open_objectives_cb=None,
@@ -30,8 +58,34 @@ class CentralBar:
         # Local State
         self.show_speed_controls = False 
         self.active_tag = "" 
+        # Per-tag resources, rebuilt only when the displayed tag changes
+        self._resolved_tag: Optional[str] = None
+        self._tag_label = "  "
+        self._flag_texture = None
         self.is_own = True
         self._switch_request: Optional[str] = None
+        self._selector_open = False  # Set when the debug popup is opened; skips it entirely while closed
+        self._selector_scroll_pending = False  # Scroll the list to the active tag on the popup's first frame
+
+        # Packed draw-list colours, resolved on first use and again only if the theme changes
+        self._u32: Dict[str, int] = {}
+        self._u32_source: Optional[Tuple[tuple, ...]] = None
+
+        # (layout key, geometry) - geometry only changes when the screen is resized
+        self._layout_cache: Tuple[Optional[tuple], Optional[tuple]] = (None, None)
+
+        # Last date string shown and its (date, time, full text) split
+        self._last_date: Optional[str] = None
+        self._date_parts: Tuple[str, str, str] = ("N/A", "", "N/A    ")
+
+        # (text, font size) -> measured size; bounded, oldest entries dropped first
+        self._text_size_cache: Dict[Tuple[str, float], Tuple[float, float]] = {}
+
+        # (backplate key, corner points) - the bar's static background rectangles
+        self._backplate_cache: Tuple[Optional[tuple], Optional[tuple]] = (None, None)
+
+        # (countries table it was built from, [(tag, label)]) for the debug selector
+        self._country_cache: Tuple[Any, List[Tuple[str, str]]] = (None, [])
 
         # Layout configuration
         self.height = 100.0                 
@@ -43,107 +97,150 @@ class CentralBar:
         Main render loop.
         Returns: A string (Country Tag) if the user selected a new country from the debug popup, else None.
         """
+        if target_tag != self._resolved_tag:
+            self._resolved_tag = target_tag
+            self._tag_label = f" {target_tag} "
+            self._flag_texture = self.flag_renderer.get_texture(target_tag)
         self.active_tag = target_tag
         self.is_own = is_own_country
         self._switch_request = None 
+
+        # The window is minimised: nothing to lay out or draw
+        viewport_size = imgui.get_main_viewport().size
+        if viewport_size.x <= 0 or viewport_size.y <= 0:
+            return None
         
-        # 1. Calculate Geometry
-        viewport = imgui.get_main_viewport()
-        screen_w, screen_h = viewport.size.x, viewport.size.y
-        
-        bar_width = max(700.0, min(screen_w * 0.45, 800.0))
-        pos_x = (screen_w - bar_width) / 2
-        pos_y = screen_h - self.height - 15 
+        # 1. Calculate Geometry (positions come back as ready-made tuples, reused every frame)
+        (window_pos, window_size, top_h, ticker_h, inner_content_h, right_section_w,
+         flag_pos, time_pos, actions_pos, ticker_pos) = self._layout(viewport_size.x, viewport_size.y)
 
-        imgui.set_next_window_pos((pos_x, pos_y))
-        imgui.set_next_window_size((bar_width, self.height))
+        imgui.set_next_window_pos(window_pos)
+        imgui.set_next_window_size(window_size)
         imgui.push_style_var(imgui.StyleVar_.window_padding, (0, 0))
 
         # 2. Window Setup
-        flags = (imgui.WindowFlags_.no_decoration | 
-                 imgui.WindowFlags_.no_move | 
-                 imgui.WindowFlags_.no_scroll_with_mouse |
-                 imgui.WindowFlags_.no_background)
-
-        if imgui.begin("CentralBar", True, flags):
-            try:
-                # Layout calculations
-                w = imgui.get_window_width()
-                h = imgui.get_window_height()
-                top_h = h * self.top_section_h_pct
-                ticker_h = h - top_h
-                inner_content_h = top_h * self.content_scale_factor
-                content_pad_y = (top_h - inner_content_h) / 2
-                padding_x = 12.0
+        # begin() returns (expanded, open); a tuple is always truthy, so unpack it
+        expanded, _ = imgui.begin("CentralBar", True, self._WINDOW_FLAGS)
+        try:
+            if expanded:
+                # The window is pinned to exactly window_size (no decoration / resize)
+                w, h = window_size
 
                 # 3. Draw Custom Background
-                self._render_background(w, h, top_h)
+                self._render_background(window_pos[0], window_pos[1], w, h, top_h)
 
                 # 4. Render Content Sections
                 
                 # Left: Flag & Country Info
-                imgui.set_cursor_pos((padding_x, content_pad_y))
+                imgui.set_cursor_pos(flag_pos)
                 self._render_flag_section(inner_content_h)
 
                 # Right: Time Controls
-                right_section_w = 250.0
-                right_start_x = w - right_section_w - padding_x
-                imgui.set_cursor_pos((right_start_x, content_pad_y))
+                imgui.set_cursor_pos(time_pos)
                 self._render_time_section(state, net, right_section_w, inner_content_h)
 
                 # Center: Quick Actions
-                # Centered between the left section (Flag) and right section (Time)
-                left_section_w = 200.0 
-                avail_center_w = right_start_x - (left_section_w + padding_x)
-                center_start_x = (left_section_w + padding_x) + (avail_center_w / 2)
-                
-                # We center the buttons around 'center_start_x' inside _render_quick_actions
-                imgui.set_cursor_pos((center_start_x, content_pad_y))
+                # actions_pos already centres the button group in the free space
+                imgui.set_cursor_pos(actions_pos)
                 self._render_quick_actions(inner_content_h, hud_summary)
 
                 # Bottom: Ticker
-                imgui.set_cursor_pos((0, top_h))
+                imgui.set_cursor_pos(ticker_pos)
                 self._render_ticker(w, ticker_h, hud_summary.ticker_text)
 
-                # 5. Debug Popups
-                self._render_debug_selector(state)
+                # 5. Debug Popups (only this bar opens the selector, so skip the call while it is closed)
+                if self._selector_open:
+                    self._render_debug_selector(state)
 
-            except Exception as e:
-                print(f"[CentralBar] Render Error: {e}")
-            finally:
-                imgui.end()
+        except Exception as e:
+            print(f"[CentralBar] Render Error: {e}")
+        finally:
+            imgui.end()
         
         imgui.pop_style_var() 
         return self._switch_request
 
+    def _layout(self, screen_w: float, screen_h: float) -> tuple:
+        """Bar geometry for a screen size; recomputed only when the size (or bar config) changes."""
+        key = (screen_w, screen_h, self.height, self.top_section_h_pct, self.content_scale_factor)
+        cached_key, geometry = self._layout_cache
+        if key == cached_key:
+            return geometry
+
+        bar_width = max(700.0, min(screen_w * 0.45, 800.0))
+        pos_x = (screen_w - bar_width) / 2
+        pos_y = screen_h - self.height - 15 
+
+        top_h = self.height * self.top_section_h_pct
+        ticker_h = self.height - top_h
+        inner_content_h = top_h * self.content_scale_factor
+        content_pad_y = (top_h - inner_content_h) / 2
+        padding_x = 12.0
+
+        right_section_w = 250.0
+        right_start_x = bar_width - right_section_w - padding_x
+
+        # Centered between the left section (Flag) and right section (Time)
+        left_section_w = 200.0 
+        avail_center_w = right_start_x - (left_section_w + padding_x)
+        center_start_x = (left_section_w + padding_x) + (avail_center_w / 2)
+
+        # Quick-action buttons are square (inner_content_h) and centred on center_start_x
+        btn_count = len(self._QUICK_ACTIONS)
+        actions_w = (inner_content_h * btn_count) + (self._QUICK_ACTION_SPACING * (btn_count - 1))
+        actions_start_x = center_start_x - (actions_w / 2)
+
+        geometry = ((pos_x, pos_y), (bar_width, self.height), top_h, ticker_h, inner_content_h,
+                    right_section_w, (padding_x, content_pad_y), (right_start_x, content_pad_y),
+                    (actions_start_x, content_pad_y), (0, top_h))
+        self._layout_cache = (key, geometry)
+        return geometry
+
     # =========================================================================
     # Sub-Renderers
     # =========================================================================
 
-    def _render_background(self, w: float, h: float, split_y: float):
+    def _render_background(self, x: float, y: float, w: float, h: float, split_y: float):
         """Draws the specific two-tone glass background for the bar."""
         draw_list = imgui.get_window_draw_list()
-        p = imgui.get_cursor_screen_pos()
+        
+        u32 = self._theme_u32()
+        top_left, split_left, split_right, bottom_right = self._backplate(x, y, w, h, split_y)
+        rounding = GAMETHEME.rounding
         
         # Top part (Main Info)
         draw_list.add_rect_filled(
-            p, (p.x + w, p.y + split_y), 
-            imgui.get_color_u32(GAMETHEME.colors.bg_window), 
-            GAMETHEME.rounding, imgui.ImDrawFlags_.round_corners_top
+            top_left, split_right, 
+            u32["panel"], 
+            rounding, imgui.ImDrawFlags_.round_corners_top
         )
         # Bottom part (Ticker - darker)
         draw_list.add_rect_filled(
-            (p.x, p.y + split_y), (p.x + w, p.y + h), 
-            imgui.get_color_u32(GAMETHEME.colors.bg_popup), 
-            GAMETHEME.rounding, imgui.ImDrawFlags_.round_corners_bottom
+            split_left, bottom_right, 
+            u32["ticker"], 
+            rounding, imgui.ImDrawFlags_.round_corners_bottom
         )
         # Outline
         draw_list.add_rect(
-            p, (p.x + w, p.y + h), 
-            imgui.get_color_u32(GAMETHEME.colors.accent), 
-            GAMETHEME.rounding, 0, 1.5
+            top_left, bottom_right, 
+            u32["border"], 
+            rounding, 0, 1.5
         )
 
+    def _backplate(self, x: float, y: float, w: float, h: float, split_y: float) -> tuple:
+        """
+        Corner points of the background rects in screen space. The window is pinned at (x, y)
+        with no padding, so they only move when the layout does.
+        """
+        key = (x, y, w, h, split_y)
+        cached_key, corners = self._backplate_cache
+        if key == cached_key:
+            return corners
+
+        corners = ((x, y), (x, y + split_y), (x + w, y + split_y), (x + w, y + h))
+        self._backplate_cache = (key, corners)
+        return corners
+
     def _render_flag_section(self, height: float):
         """Renders the flag and the country tag/status."""
         imgui.begin_group()
@@ -151,7 +248,7 @@ class CentralBar:
             flag_h = height
             flag_w = flag_h * 1.5
             
-            self.flag_renderer.draw_flag(self.active_tag, flag_w, flag_h)
+            self.flag_renderer.draw_texture(self._flag_texture, flag_w, flag_h)
 
             imgui.same_line()
 
@@ -161,8 +258,10 @@ class CentralBar:
                 row_h = (height - gap) / 2
                 
                 # Top Row: Country Tag (Clickable for debug)
-                if imgui.button(f" {self.active_tag} ", (90, row_h)):
+                if imgui.button(self._tag_label, (90, row_h)):
                     imgui.open_popup("CountrySelectorPopup")
+                    self._selector_open = True
+                    self._selector_scroll_pending = True
                 if imgui.is_item_hovered(): imgui.set_tooltip("Switch Country (Debug)")
                 
                 # Bottom Row: Status Indicator
@@ -182,20 +281,21 @@ class CentralBar:
         imgui.begin_group()
         try:
             # Toggle Button (Clock Icon)
-            if imgui.button(icons_fontawesome_6.ICON_FA_CLOCK, (40, height)):
+            if imgui.button(_ICON_CLOCK, (40, height)):
                 self.show_speed_controls = not self.show_speed_controls
             
             imgui.same_line()
             
             # LCD Display Area
-            lcd_w = width - 40 - imgui.get_style().item_spacing.x
+            # apply() sets style.item_spacing from the theme every frame, so read the source value
+            lcd_w = width - 40 - GAMETHEME.item_spacing[0]
             
             # Draw LCD Background
             p = imgui.get_cursor_screen_pos()
             draw_list = imgui.get_window_draw_list()
             draw_list.add_rect_filled(
                 p, (p.x + lcd_w, p.y + height), 
-                imgui.get_color_u32((0,0,0,0.5)), 4.0
+                self._theme_u32()["lcd"], 4.0
             )
             
             # Render LCD Content
@@ -231,9 +331,14 @@ class CentralBar:
         imgui.set_cursor_pos((start_x, start_y))
 
         # 3. Data Extraction (Fixed naming: speed_level and is_paused)
-        current_speed = getattr(state.time, "speed_level", 1) 
-        is_paused = getattr(state.time, "is_paused", False)
+        try:
+            time_state = state.time  # Fetched once for both fields
+            current_speed = time_state.speed_level
+            is_paused = time_state.is_paused
+        except AttributeError:
+            current_speed, is_paused = 1, False
         btn_size = (btn_w, btn_h) 
+        active_color = GAMETHEME.colors.interaction_active
         
         imgui.push_style_var(imgui.StyleVar_.item_spacing, (spacing, 0))
         imgui.push_style_var(imgui.StyleVar_.frame_padding, (0, 0))
@@ -241,49 +346,50 @@ class CentralBar:
 
         # 4. Render Pause Button
         if is_paused: 
-            imgui.push_style_color(imgui.Col_.button, GAMETHEME.colors.interaction_active)
-            imgui.push_style_color(imgui.Col_.button_hovered, GAMETHEME.colors.interaction_active)
+            imgui.push_style_color(imgui.Col_.button, active_color)
+            imgui.push_style_color(imgui.Col_.button_hovered, active_color)
         
         if imgui.button("||", btn_size):
             net.send_action(ActionSetPaused("local", not is_paused))
         
         if is_paused: 
             imgui.pop_style_color(2)
-        
-        imgui.same_line()
 
-        # 5. Render Speed Buttons 1-5
-        for i in range(1, 6):
-            is_active = (current_speed == i and not is_paused)
+        # 5. Render Speed Buttons 1-5 (same_line before each button keeps them on the pause row)
+        active_speed = 0 if is_paused else current_speed
+        same_line, button = imgui.same_line, imgui.button  # Looked up once for the 5 buttons
+        for i, label in self._SPEED_LABELS:
+            same_line()
+            is_active = (i == active_speed)
             
             if is_active: 
-                imgui.push_style_color(imgui.Col_.button, GAMETHEME.colors.interaction_active)
-                imgui.push_style_color(imgui.Col_.button_hovered, GAMETHEME.colors.interaction_active)
+                imgui.push_style_color(imgui.Col_.button, active_color)
+                imgui.push_style_color(imgui.Col_.button_hovered, active_color)
             
-            if imgui.button(str(i), btn_size):
+            if button(label, btn_size):
                 net.send_action(ActionSetPaused("local", False))
                 net.send_action(ActionSetGameSpeed("local", i))
             
             if is_active: 
                 imgui.pop_style_color(2)
             
-            if i < 5: 
-                imgui.same_line()
-            
         imgui.pop_style_var(3)
 
     def _draw_date_display(self, state, avail_w, avail_h):
         """Renders the text date."""
-        t = state.time
-        parts = t.date_str.split(" ")
-        date_part = parts[0] if len(parts) > 0 else "N/A"
-        time_part = parts[1] if len(parts) > 1 else ""
+        date_str = state.time.date_str
+        if date_str != self._last_date:
+            # The date only advances with game ticks; re-split it only when it changes
+            # partition always yields a 3-tuple; with no space time_part is simply ""
+            date_part, _, time_part = date_str.partition(" ")
+            self._date_parts = (date_part, time_part, f"{date_part}    {time_part}")
+            self._last_date = date_str
+        date_part, time_part, full_text = self._date_parts
         
-        full_text = f"{date_part}    {time_part}"
-        text_size = imgui.calc_text_size(full_text)
+        text_w, text_h = self._text_size(full_text)
         
-        pos_x = (avail_w - text_size.x) / 2
-        pos_y = (avail_h - text_size.y) / 2
+        pos_x = (avail_w - text_w) / 2
+        pos_y = (avail_h - text_h) / 2
         
         imgui.set_cursor_pos((pos_x, pos_y))
         imgui.text_colored(GAMETHEME.colors.text_main, date_part)
@@ -295,40 +401,23 @@ class CentralBar:
         if not self.is_own:
             imgui.begin_disabled()
 
-        btn_count = 3
-        spacing = 10.0
         btn_sz = (height, height)
-        
-        # Calculate width of the group to center it properly relative to the cursor start
-        group_width = (height * btn_count) + (spacing * (btn_count - 1))
-        
-        # Offset cursor back by half the group width to center on the point provided
-        current_x = imgui.get_cursor_pos_x()
-        imgui.set_cursor_pos_x(current_x - (group_width / 2))
 
-        imgui.push_style_var(imgui.StyleVar_.item_spacing, (spacing, 0))
-        
-        # 1. AI Button
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_BRAIN}", btn_sz):
-            if self._open_objectives_cb:
-                self._open_objectives_cb()
-        if imgui.is_item_hovered(): imgui.set_tooltip(f"Objectives ({hud_summary.active_objectives})")
-        imgui.same_line()
+        # The cursor is already at the group's left edge (centred in _layout). The buttons are
+        # fixed-width, so each one is placed at a known x instead of pushing item_spacing for same_line
+        start_x = imgui.get_cursor_pos_x()
+        step = height + self._QUICK_ACTION_SPACING
         
-        # 2. Statistics
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_CHART_LINE}", btn_sz):
-            if self._open_statistics_cb:
-                self._open_statistics_cb()
-        if imgui.is_item_hovered(): imgui.set_tooltip("Statistics")
-        imgui.same_line()
-        
-        # 3. Messages
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_ENVELOPE}", btn_sz):
-            if self._open_mail_cb:
-                self._open_mail_cb()
-        if imgui.is_item_hovered(): imgui.set_tooltip(f"Messages ({hud_summary.unread_messages} unread)")
-        
-        imgui.pop_style_var()
+        # Objectives, Statistics, Messages - tooltips are only formatted while hovered
+        for i, (icon, callback_attr, tooltip) in enumerate(self._QUICK_ACTIONS):
+            if i:
+                imgui.same_line(start_x + i * step)
+            if imgui.button(icon, btn_sz):
+                callback = getattr(self, callback_attr)
+                if callback:
+                    callback()
+            # Plain is_item_hovered(): no tooltip delay, and none while the buttons are disabled
+            if imgui.is_item_hovered(): imgui.set_tooltip(tooltip.format(hud_summary))
 
         if not self.is_own:
             imgui.end_disabled()
@@ -354,7 +443,7 @@ class CentralBar:
         imgui.set_cursor_pos((btn_x, btn_y))
         
         imgui.push_style_color(imgui.Col_.button, GAMETHEME.colors.bg_child)
-        if imgui.button(icons_fontawesome_6.ICON_FA_NEWSPAPER, (btn_w, btn_h)):
+        if imgui.button(_ICON_NEWS, (btn_w, btn_h)):
             if self._open_news_cb:
                 self._open_news_cb()
         imgui.pop_style_color()
@@ -364,38 +453,104 @@ class CentralBar:
     def _render_debug_selector(self, state):
         """Renders the Country Selector Popup for debug/view switching."""
         imgui.set_next_window_size((300, 400))
-        if imgui.begin_popup("CountrySelectorPopup"):
-            imgui.text_disabled("Switch Viewpoint (Debug)")
-            imgui.separator()
-            
-            if "countries" in state.tables:
-                df = state.tables["countries"]
-                try: df = df.sort("id")
-                except: pass
-                
-                imgui.begin_child("CountryList", (0, 0), True)
-                for row in df.iter_rows(named=True):
-                    tag = row['id']
-                    name = row.get('name', tag)
-                    label = f"{tag} - {name}"
-                    
-                    is_selected = (tag == self.active_tag)
+        if not imgui.begin_popup("CountrySelectorPopup"):
+            self._selector_open = False  # Dismissed (clicked outside / Esc)
+            return
+
+        imgui.text_disabled("Switch Viewpoint (Debug)")
+        imgui.separator()
+        
+        if "countries" in state.tables:
+            imgui.begin_child("CountryList", (0, 0), True)
+            rows = self._country_rows(state.tables["countries"])
+            selectable, active_tag = imgui.selectable, self.active_tag  # Hoisted out of the per-country loop
+            scroll_to_selected = self._selector_scroll_pending
+            self._selector_scroll_pending = False
+
+            # Only the rows inside the visible part of the child are submitted
+            clipper = imgui.ListClipper()
+            clipper.begin(len(rows))
+            if scroll_to_selected:
+                # Make sure the active row is submitted so it can scroll itself into view
+                selected_index = next((i for i, (tag, _) in enumerate(rows) if tag == active_tag), None)
+                if selected_index is not None:
+                    clipper.include_item_by_index(selected_index)
+
+            while clipper.step():
+                for i in range(clipper.display_start, clipper.display_end):
+                    tag, label = rows[i]
+                    is_selected = (tag == active_tag)
                     if is_selected:
                         imgui.push_style_color(imgui.Col_.text, GAMETHEME.colors.accent)
                     
-                    if imgui.selectable(label, is_selected)[0]:
+                    if selectable(label, is_selected)[0]:
                         self._switch_request = tag
                         imgui.close_current_popup()
+                        self._selector_open = False
                         
                     if is_selected:
                         imgui.pop_style_color()
-                        imgui.set_scroll_here_y()
-                        
-                imgui.end_child()
-            else:
-                imgui.text_colored(GAMETHEME.colors.error, "No country data loaded.")
-                
-            imgui.end_popup()
+                        if scroll_to_selected:
+                            imgui.set_scroll_here_y()
+                    
+            imgui.end_child()
+        else:
+            imgui.text_colored(GAMETHEME.colors.error, "No country data loaded.")
+            
+        imgui.end_popup()
+
+    def _country_rows(self, df) -> List[Tuple[str, str]]:
+        """
+        Sorted (tag, label) pairs for the selector, rebuilt only when the countries table
+        object changes (snapshots replace tables rather than mutating them).
+        """
+        cached_df, rows = self._country_cache
+        if df is cached_df:
+            return rows
+
+        # Runs once per table object; check the schema instead of catching a failed sort
+        sorted_df = df.sort("id") if "id" in df.columns else df
+
+        # Build the labels in one vectorised pass instead of a dict + f-string per row
+        tag_col = pl.col("id").cast(pl.Utf8)
+        name_col = pl.col("name").cast(pl.Utf8).fill_null(tag_col) if "name" in sorted_df.columns else tag_col
+        labels = sorted_df.select(
+            tag_col.alias("tag"),
+            pl.concat_str([tag_col, pl.lit(" - "), name_col]).alias("label"),
+        )
+        rows = list(zip(labels["tag"].to_list(), labels["label"].to_list()))
+        self._country_cache = (df, rows)
+        return rows
+
+    def _text_size(self, text: str) -> Tuple[float, float]:
+        """calc_text_size walks the glyphs of `text`; labels that repeat are measured once per font size."""
+        key = (text, imgui.get_font_size())
+        size = self._text_size_cache.get(key)
+        if size is None:
+            measured = imgui.calc_text_size(text)
+            size = (measured.x, measured.y)
+            if len(self._text_size_cache) >= self._TEXT_SIZE_CACHE_LIMIT:
+                del self._text_size_cache[next(iter(self._text_size_cache))]
+            self._text_size_cache[key] = size
+        return size
+
+    def _theme_u32(self) -> Dict[str, int]:
+        """
+        Packed colours for the draw-list calls. get_color_u32 crosses into C++ each call, so the
+        results are kept until the source theme colours change (a cheap tuple compare).
+        The packed value is pre-multiplied by style.alpha, so the global alpha is part of the key.
+        """
+        colors = GAMETHEME.colors
+        source = (colors.bg_window, colors.bg_popup, colors.accent, imgui.get_style().alpha)
+        if source != self._u32_source:
+            self._u32 = {
+                "panel": imgui.get_color_u32(colors.bg_window),
+                "ticker": imgui.get_color_u32(colors.bg_popup),
+                "border": imgui.get_color_u32(colors.accent),
+                "lcd": imgui.get_color_u32((0, 0, 0, 0.5)),
+            }
+            self._u32_source = source
+        return self._u32
 
     def _draw_status_label(self, label: str, color: tuple, height: float, width: float = 40):
         """Helper to draw a colored status badge."""
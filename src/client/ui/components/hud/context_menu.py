@@ -86,9 +86,10 @@ class ContextMenu:
 
             # B. Dynamic Modes (Political, Economic, etc.)
             if hasattr(self.viewport, "map_modes"):
+                current_key = getattr(self.viewport, "current_mode_key", "")
                 for key, mode_obj in self.viewport.map_modes.items():
                     # Highlight if active
-                    is_active = (getattr(self.viewport, "current_mode_key", "") == key)
+                    is_active = (current_key == key)
 
                     if imgui.menu_item(mode_obj.name, "", is_active)[0]:
                         self.viewport.set_map_mode(key)
@@ -1,10 +1,12 @@
-import arcade
 import ctypes  # Required for raw pointer handling in ImGui
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from imgui_bundle import imgui
 from src.client.ui.core.theme import UITheme
 from src.client.services.imgui_service import ImGuiService
 
+if TYPE_CHECKING:
+    import arcade
+
 class UIComposer:
     """
     A high-level UI composition helper.
@@ -294,7 +296,7 @@ class UIComposer:
     # 4. IMAGES & TEXTURES
     # =========================================================
 
-    def draw_image(self, texture: arcade.Texture, width: float, height: float):
+    def draw_image(self, texture: "arcade.Texture", width: float, height: float):
         """
         Draws an Arcade Texture in ImGui. 
         Handles GL ID extraction and ImVec2 type casting automatically.
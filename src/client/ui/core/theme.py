@@ -58,6 +58,7 @@ class UITheme:
     """
     colors: UIColors = field(default_factory=UIColors)
     rounding: float = 0.0
+    item_spacing: tuple = (10, 8)  # Also read by widgets that lay out against it (no style round trip)
 
     def apply(self):
         style = imgui.get_style()
@@ -69,7 +70,7 @@ class UITheme:
         # 1. Geometry Defaults
         style.window_padding    = (14, 14)
         style.frame_padding     = (8, 5)
-        style.item_spacing      = (10, 8)
+        style.item_spacing      = self.item_spacing
         style.window_rounding   = self.rounding
         style.frame_rounding    = self.rounding
         style.popup_rounding    = self.rounding
@@ -1,4 +1,3 @@
-import arcade
 from typing import Optional, Any, Dict
 from src.client.ui.panels.data_insp_panel import DataInspectorPanel
 from src.client.services.network_client_service import NetworkClient
@@ -16,7 +16,31 @@ class HudFeedSummary:
 class FeedPresenter:
     """Builds lightweight HUD and service panel models from the shared state."""
 
+    SUMMARY_TABLES = ("messages", "news_items", "objectives")
+
+    def __init__(self):
+        # (country_tag, source tables, summary) from the last build_summary call
+        self._summary_cache: tuple = (None, (), None)
+
     def build_summary(self, state, country_tag: str) -> HudFeedSummary:
+        """
+        The HUD asks for this every frame, but the feed tables only change when a snapshot
+        replaces them, so the summary is rebuilt only when the tag or a source table object changes.
+        """
+        tables = tuple(state.tables.get(name) for name in self.SUMMARY_TABLES)
+        cached_tag, cached_tables, summary = self._summary_cache
+        if (
+            summary is not None
+            and cached_tag == country_tag
+            and all(table is cached for table, cached in zip(tables, cached_tables))
+        ):
+            return summary
+
+        summary = self._build_summary(state, country_tag)
+        self._summary_cache = (country_tag, tables, summary)
+        return summary
+
+    def _build_summary(self, state, country_tag: str) -> HudFeedSummary:
         messages = self.messages_for_country(state, country_tag)
         news_items = self.news_for_country(state, country_tag)
         objectives = self.objectives_for_country(state, country_tag)
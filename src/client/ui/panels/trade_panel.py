@@ -1,3 +1,5 @@
+from typing import List, Tuple
+
 import polars as pl
 from imgui_bundle import imgui
 
@@ -10,6 +12,8 @@ class TradePanel:
     """Negotiation UI for diplomatic territory and technology deals."""
 
     DEAL_TYPES = ["Territory Transfer", "Technology Transfer"]
+    # Name columns tried in order for a partner's label; the tag is the final fallback
+    NAME_COLUMNS = ("name", "display_name", "country_name")
 
     def __init__(self):
         self.deal_type_idx = 0
@@ -19,6 +23,9 @@ class TradePanel:
         self.offer_tech_idx = 0
         self.request_tech_idx = 0
 
+        # ((countries table, excluded tag), partner tags, partner labels)
+        self._partner_cache: Tuple[tuple, List[str], List[str]] = ((None, None), [], [])
+
     def render(self, state, context: PanelRenderContext) -> bool:
         with WindowManager.window("DIPLOMATIC TRADE", x=720, y=120, w=760, h=620) as is_open:
             if not is_open:
@@ -42,14 +49,14 @@ class TradePanel:
         )
         imgui.dummy((0, 8))
 
-        partners = self._country_options(state, exclude_tag=target_tag)
-        if not partners:
+        partner_tags, partner_labels = self._country_options(state, exclude_tag=target_tag)
+        if not partner_tags:
             imgui.text_disabled("No trade partners are available in the countries table.")
             imgui.pop_style_var()
             return
 
-        self.partner_idx = max(0, min(self.partner_idx, len(partners) - 1))
-        partner_tag, _ = partners[self.partner_idx]
+        self.partner_idx = max(0, min(self.partner_idx, len(partner_tags) - 1))
+        partner_tag = partner_tags[self.partner_idx]
 
         imgui.text_disabled("PARTNER")
         imgui.same_line(140)
@@ -57,10 +64,10 @@ class TradePanel:
         changed, self.partner_idx = imgui.combo(
             "##trade_partner",
             self.partner_idx,
-            [label for _, label in partners],
+            partner_labels,
         )
         if changed:
-            partner_tag, _ = partners[self.partner_idx]
+            partner_tag = partner_tags[self.partner_idx]
             self.offer_region_idx = 0
             self.request_region_idx = 0
             self.offer_tech_idx = 0
@@ -84,25 +91,42 @@ class TradePanel:
         self._render_submit_area(is_own)
         imgui.pop_style_var()
 
-    def _country_options(self, state, exclude_tag: str) -> list[tuple[str, str]]:
+    def _country_options(self, state, exclude_tag: str) -> Tuple[List[str], List[str]]:
+        """
+        Partner (tags, labels) as parallel lists sorted by label. Built with column
+        expressions and cached until the countries table or the excluded tag changes.
+        """
         if "countries" not in state.tables:
-            return []
+            return [], []
 
         try:
             countries = state.get_table("countries")
+            (cached_table, cached_exclude), tags, labels = self._partner_cache
+            if countries is cached_table and exclude_tag == cached_exclude:
+                return tags, labels
             if "id" not in countries.columns:
-                return []
-
-            labels = []
-            for row in countries.iter_rows(named=True):
-                tag = str(row.get("id") or "")
-                if not tag or tag == exclude_tag:
-                    continue
-                name = row.get("name") or row.get("display_name") or row.get("country_name") or tag
-                labels.append((tag, f"{name} ({tag})"))
-            return sorted(labels, key=lambda item: item[1])
+                return [], []
+
+            tag = pl.col("id").cast(pl.Utf8)
+            # Empty names fall through to the next column, like the `or` chain they replace
+            names = [
+                pl.when(pl.col(column).cast(pl.Utf8) != "").then(pl.col(column).cast(pl.Utf8))
+                for column in self.NAME_COLUMNS
+                if column in countries.columns
+            ]
+            options = (
+                countries.select(
+                    tag.alias("tag"),
+                    pl.format("{} ({})", pl.coalesce([*names, tag]), tag).alias("label"),
+                )
+                .filter(pl.col("tag").is_not_null() & (pl.col("tag") != "") & (pl.col("tag") != exclude_tag))
+                .sort("label", maintain_order=True)
+            )
+            tags, labels = options["tag"].to_list(), options["label"].to_list()
+            self._partner_cache = ((countries, exclude_tag), tags, labels)
+            return tags, labels
         except Exception:
-            return []
+            return [], []
 
     def _render_context_summary(self, state, target_tag: str, partner_tag: str, selected_region_id):
         Prims.header("NEGOTIATION CONTEXT", show_bg=False)
@@ -68,6 +68,7 @@ class EditorView(BaseImGuiView):
         current_mode = self.layout.get_current_render_mode()
         is_overlay_enabled = (current_mode != "terrain")
         self.renderer.set_overlay_style(enabled=is_overlay_enabled, opacity=0.90)
+        self.viewport_ctrl.poll_pending_updates()
         self.renderer.draw()
         
         self.window.use()
@@ -146,6 +146,7 @@ class GameView(BaseImGuiView):
         ctx.viewport = (0, 0, self.window.width, self.window.height)
         ctx.enable_only((ctx.DEPTH_TEST, ctx.BLEND))
 
+        self.viewport_ctrl.poll_pending_updates()
         self.renderer.draw()
 
         # 4. Render Unit Overlay and UI
@@ -127,12 +127,12 @@ class LoadGameView(BaseImGuiView):
                 self.status_text = "Synchronizing game state..."
                 self.progress = 0.9
 
-                start_time = time.perf_counter()
+                deadline = time.perf_counter() + 5.0
                 while new_session.get_state_snapshot() is None:
-                    new_session.tick(0.0)
-                    if time.perf_counter() - start_time > 5.0:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0.0:
                         raise TimeoutError("Timed out waiting for loaded game state.")
-                    time.sleep(0.05)
+                    new_session.wait_for_state(remaining)
 
                 self.progress = 1.0
                 self.status_text = "Ready."
@@ -1,6 +1,6 @@
 import arcade
 import polars as pl
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from src.client.views.base_view import BaseImGuiView
 from src.client.services.network_client_service import NetworkClient
@@ -28,6 +28,8 @@ class NewGameView(BaseImGuiView):
         
         self.selected_country_id: Optional[str] = None
         self.playable_countries = self._fetch_playable_countries()
+        # (id, label) rows for the country list, built once instead of per frame
+        self._country_rows = self._build_country_rows(self.playable_countries)
 
         # --- USE SHARED RENDERER ---
         if self.window.shared_renderer:
@@ -41,9 +43,9 @@ class NewGameView(BaseImGuiView):
             
             # We must still generate the data map so the renderer knows "USA = Region 45, 46..."
             # even if we aren't showing the colors right now.
-            self._refresh_political_map()
-            
-            self.renderer.clear_highlight()
+            # Starts with nothing highlighted; cleared in the same LUT rebuild as the colours.
+            if not self._refresh_political_map(highlight=[]):
+                self.renderer.clear_highlight()
         else:
             # Fallback
             from src.client.renderers.map_renderer import MapRenderer
@@ -58,17 +60,18 @@ class NewGameView(BaseImGuiView):
             self.renderer.set_overlay_style(enabled=True, opacity=0.0)
             self._refresh_political_map()
 
-    def _refresh_political_map(self):
+    def _refresh_political_map(self, highlight: Optional[List[int]] = None) -> bool:
         """
         Generates the Region ID -> Color mapping.
         Required for the renderer to know which pixels belong to the selected country.
+        Returns False if no overlay (and so no highlight) was applied.
         """
         try:
             state = self.net.get_state()
-            if "regions" not in state.tables: return
+            if "regions" not in state.tables: return False
 
             df = state.get_table("regions")
-            if "owner" not in df.columns or "id" not in df.columns: return
+            if "owner" not in df.columns or "id" not in df.columns: return False
 
             unique_owners = df["owner"].unique().to_list()
             tag_palette = generate_political_colors(unique_owners)
@@ -84,10 +87,12 @@ class NewGameView(BaseImGuiView):
                 color = tag_palette.get(owner, fallback_c)
                 region_color_map[rid] = color
             
-            self.renderer.update_overlay(region_color_map)
+            self.renderer.update_overlay(region_color_map, highlight=highlight)
+            return True
             
         except Exception as e:
             print(f"[NewGameView] Color Generation Error: {e}")
+            return False
 
     def _fetch_playable_countries(self) -> pl.DataFrame:
         try:
@@ -97,6 +102,15 @@ class NewGameView(BaseImGuiView):
         except KeyError:
             return pl.DataFrame()
 
+    @staticmethod
+    def _build_country_rows(countries: pl.DataFrame) -> List[tuple]:
+        """Pulls whole columns out of Polars in one call each rather than a dict per row."""
+        if countries.is_empty():
+            return []
+        ids = countries["id"].to_list()
+        names = countries["name"].to_list() if "name" in countries.columns else [""] * len(ids)
+        return [(c_id, f"{c_id} - {name}") for c_id, name in zip(ids, names)]
+
     def on_show_view(self):
         pass
 
@@ -129,10 +143,8 @@ class NewGameView(BaseImGuiView):
             # Left Column: Country List
             # Height 400 allows enough space for list while leaving room for bottom buttons
             imgui.begin_child("CountryList", (250, 400), True)
-            if not self.playable_countries.is_empty():
-                for row in self.playable_countries.iter_rows(named=True):
-                    c_id = row['id']
-                    label = f"{c_id} - {row.get('name', '')}"
+            if self._country_rows:
+                for c_id, label in self._country_rows:
                     is_selected = (self.selected_country_id == c_id)
                     
                     if imgui.selectable(label, is_selected)[0]:
@@ -6,6 +6,11 @@ from src.shared.state import GameState
 
 
 class PoliticalMapMode(BaseMapMode):
+    def __init__(self):
+        # Tag colors are deterministic, so the palette persists across refreshes
+        # and only grows when a new tag appears on the map.
+        self._palette: Dict[str, Tuple[int, int, int]] = {}
+
     @property
     def name(self) -> str:
         return "Political"
@@ -19,17 +24,15 @@ class PoliticalMapMode(BaseMapMode):
         if authority_col is None:
             return {}
 
-        unique_owners = df[authority_col].unique().to_list()
-        palette = generate_political_colors(unique_owners)
-        rows = df.select(["id", authority_col]).to_dicts()
-
-        result = {}
-        for row in rows:
-            rid = row["id"]
-            authority_tag = row[authority_col]
-            result[rid] = palette.get(authority_tag, (50, 50, 50))
+        palette = self._palette
+        new_tags = [tag for tag in df[authority_col].unique().to_list() if tag not in palette]
+        if new_tags:
+            palette.update(generate_political_colors(new_tags))
 
-        return result
+        fallback = (50, 50, 50)
+        region_ids = df["id"].to_list()
+        colors = [palette.get(tag, fallback) for tag in df[authority_col].to_list()]
+        return dict(zip(region_ids, colors))
 
     def _authority_column(self, df):
         if "controller" in df.columns:
@@ -1,12 +1,24 @@
 import hashlib
+import json
+import queue
 import threading
 import os
 import shutil
 import numpy as np
 from pathlib import Path
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict
 from src.core.paths import ProjectPaths
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
 class CacheService:
     """
     Centralized service for managing disk caching of generated assets.
@@ -15,6 +27,13 @@ class CacheService:
     def __init__(self, project_root: Path = None):
         self.project_root = project_root or ProjectPaths.root()
         self.cache_dir = ProjectPaths.cache()
+        self._path_hash_cache: Dict[Path, str] = {}  # source path -> fingerprint, skips resolve()
+
+        # Background saves run one at a time on a single worker, started on demand
+        self._save_queue: "queue.Queue[tuple]" = queue.Queue()
+        self._save_lock = threading.Lock()
+        self._saver_running = False
+
         self._ensure_cache_dir()
 
     def _ensure_cache_dir(self):
@@ -30,8 +49,11 @@ class CacheService:
         Generates a consistent, unique cache path using a hash of the full source path.
         Prevents collisions when multiple files have the same name (e.g. 'terrain.png').
         """
-        # Create a hash of the absolute path to ensure uniqueness
-        path_hash = hashlib.md5(str(source_path.resolve()).encode('utf-8')).hexdigest()[:12]
+        path_hash = self._path_hash_cache.get(source_path)
+        if path_hash is None:
+            # Create a hash of the absolute path to ensure uniqueness
+            path_hash = hashlib.md5(str(source_path.resolve()).encode('utf-8')).hexdigest()[:12]
+            self._path_hash_cache[source_path] = path_hash
         
         # Keep the stem for readability, but append hash
         filename = f"{source_path.stem}_{path_hash}{suffix}"
@@ -44,7 +66,16 @@ class CacheService:
     # --- Validation ---
 
     def compute_file_hash(self, file_path: Path) -> str:
-        """Computes SHA-256 hash of a file for integrity checking."""
+        """
+        Computes a content hash of a file for integrity checking.
+        Uses multithreaded, SIMD BLAKE3 over a memory map when available, SHA-256 otherwise.
+        """
+        if blake3 is not None:
+            try:
+                return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(str(file_path)).hexdigest()
+            except FileNotFoundError:
+                return "FILE_NOT_FOUND"
+
         sha256 = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
@@ -97,8 +128,7 @@ class CacheService:
     def save_numpy_array(self, path: Path, data: np.ndarray, in_background: bool = True):
         """Saves a .npy file using atomic write pattern."""
         if in_background:
-            # non-daemon thread ensures data is saved even if app initiates exit
-            threading.Thread(target=self._save_numpy_worker, args=(path, data), daemon=False).start()
+            self._enqueue_save(self._save_numpy_worker, path, data)
         else:
             self._save_numpy_worker(path, data)
 
@@ -112,8 +142,12 @@ class CacheService:
         tmp_path = path.parent / f"{path.name}.tmp.npy"
         
         try:
-            # np.save sees .npy at the end and writes exactly to tmp_path
-            np.save(tmp_path, data)
+            # Written through a memmap of the final .npy layout: one vectorized copy into the
+            # page cache instead of np.save's intermediate byte buffers
+            mm = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=data.dtype, shape=data.shape)
+            np.copyto(mm, data)
+            mm.flush()  # msync: the data is on disk before the rename makes it visible
+            del mm
             
             # Atomic replace (overwrite if exists)
             os.replace(tmp_path, path)
@@ -128,6 +162,93 @@ class CacheService:
                 except OSError:
                     pass
 
+    # --- LZ4 Frames (optional) ---
+
+    @property
+    def lz4_available(self) -> bool:
+        return lz4 is not None
+
+    def load_numpy_lz4(self, path: Path) -> Optional[np.ndarray]:
+        """
+        Loads an array saved by save_numpy_lz4 (LZ4 frame + .meta.json sidecar).
+        LZ4 decodes at several GB/s, so large caches load faster than reading the raw .npy.
+        """
+        meta_path = self._lz4_meta_path(path)
+        if lz4 is None or not path.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            dtype, shape = np.dtype(meta["dtype"]), tuple(meta["shape"])
+            # bytearray keeps the result writable, as arcade's upload path requires
+            raw = lz4.frame.decompress(path.read_bytes(), return_bytearray=True)
+            return np.frombuffer(raw, dtype=dtype).reshape(shape)
+        except Exception as e:
+            print(f"[CacheService] LZ4 load failed (corrupt?): {path.name}: {e}")
+            return None
+
+    def save_numpy_lz4(self, path: Path, data: np.ndarray, in_background: bool = True):
+        """Saves an array as an LZ4 frame (fastest level) plus a .meta.json with its shape/dtype."""
+        if in_background:
+            self._enqueue_save(self._save_lz4_worker, path, data)
+        else:
+            self._save_lz4_worker(path, data)
+
+    def _save_lz4_worker(self, path: Path, data: np.ndarray):
+        meta_path = self._lz4_meta_path(path)
+        tmp_path = path.parent / f"{path.name}.tmp"
+        try:
+            meta = {"dtype": data.dtype.str, "shape": list(data.shape)}
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+            with open(tmp_path, "wb") as raw:
+                with lz4.frame.LZ4FrameFile(raw, "wb", compression_level=0) as f:
+                    f.write(memoryview(np.ascontiguousarray(data)).cast("B"))
+                raw.flush()
+                os.fsync(raw.fileno())
+            # The frame is renamed last, so a readable .lz4 always has its metadata beside it
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[CacheService] LZ4 save failed for {path.name}: {e}")
+            if tmp_path.exists():
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _lz4_meta_path(path: Path) -> Path:
+        return path.with_name(f"{path.name}.meta.json")
+
+    # --- Background Saver ---
+
+    def close(self):
+        """Blocks until every queued background save has been written."""
+        self._save_queue.join()
+
+    def _enqueue_save(self, worker: Callable[[Path, np.ndarray], None], path: Path, data: np.ndarray):
+        """
+        Queues a save for the single saver thread, so concurrent cache writes don't compete for the disk.
+        The thread is non-daemon (pending saves finish even if the app initiates exit) and exits
+        once the queue is empty, so an idle service holds no thread.
+        """
+        with self._save_lock:
+            self._save_queue.put((worker, path, data))
+            if not self._saver_running:
+                self._saver_running = True
+                threading.Thread(target=self._save_loop, name="cache-saver", daemon=False).start()
+
+    def _save_loop(self):
+        while True:
+            with self._save_lock:
+                try:
+                    worker, path, data = self._save_queue.get_nowait()
+                except queue.Empty:
+                    self._saver_running = False
+                    return
+            try:
+                worker(path, data)
+            finally:
+                self._save_queue.task_done()
+
     def load_numpy_archive(self, path: Path) -> Optional[Dict[str, Any]]:
         """Loads a compressed .npz archive."""
         if not path.exists():
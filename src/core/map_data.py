@@ -1,19 +1,26 @@
 import cv2
 import numpy as np
+from pathlib import Path
+from typing import Optional, Tuple
+
+from src.core.cache_service import CacheService
 
 class RegionMapData:
     """
     PURE DATA. Safe for Server and Client.
     Responsible for: Loading the image and providing ID lookups.
     """
+    # Bump when the packed_map layout changes so older cache files are ignored
+    CACHE_VERSION = 1
+
     def __init__(self, image_path: str):
         # cv2.imread is safe on a headless server
         self.raw_img = cv2.imread(image_path)
         if self.raw_img is None:
             raise FileNotFoundError(f"Missing map: {image_path}")
-        
+
         self.height, self.width, _ = self.raw_img.shape
-        
+
         # Convert BGR image to a 2D array of Region IDs
         # (This is pure math/logic, perfectly fine for Core)
         b, g, r = cv2.split(self.raw_img)
@@ -23,10 +30,38 @@ class RegionMapData:
         del b, g, r
         del self.raw_img
 
+    @classmethod
+    def load_cached(cls, image_path: Path, cache: CacheService) -> Tuple["RegionMapData", bool]:
+        """
+        Loads the region map through a disk cache keyed by the image's content hash.
+        Returns (map_data, cache_hit). On a hit the packed IDs are memory-mapped read-only,
+        skipping the PNG decode and channel packing entirely.
+        """
+        content_hash = cache.compute_file_hash(image_path)
+        cache_path = cache.cache_dir / f"regionmap_v{cls.CACHE_VERSION}_{content_hash[:32]}.npy"
+
+        packed_map: Optional[np.ndarray] = None
+        if content_hash != "FILE_NOT_FOUND":
+            packed_map = cache.load_numpy_array(cache_path, mmap_mode='r')
+        if packed_map is not None and packed_map.ndim == 2 and packed_map.dtype == np.int32:
+            return cls._from_packed(packed_map), True
+
+        map_data = cls(str(image_path))
+        cache.save_numpy_array(cache_path, map_data.packed_map, in_background=True)
+        return map_data, False
+
+    @classmethod
+    def _from_packed(cls, packed_map: np.ndarray) -> "RegionMapData":
+        map_data = cls.__new__(cls)
+        map_data.packed_map = packed_map
+        map_data.height, map_data.width = packed_map.shape
+        return map_data
+
     def get_region_id(self, x: int, y: int) -> int:
         """
         Used by Server (Move Validation) and Client (Mouse Hover).
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return int(self.packed_map[y, x])
-        return 0
\ No newline at end of file
+            # .item() returns a Python int directly, skipping the NumPy scalar + int() round trip
+            return self.packed_map.item(y, x)
+        return 0
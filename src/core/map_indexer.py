@@ -53,6 +53,9 @@ class MapIndexer:
         
         # Heavy computation
         unique_ids, dense_map = np.unique(map_array, return_inverse=True)
+        # Dense IDs are uint32 texels on the GPU; storing them that way halves the archive
+        # and turns the texture encode into a same-dtype copy.
+        dense_map = dense_map.astype(np.uint32)
         
         # Save via service
         self.cache.save_numpy_archive(
@@ -33,7 +33,15 @@ def run_server_process(
 
     config = GameConfig(Path(config_root))
 
+    last_progress: Optional[tuple] = None
+
     def progress_cb(progress: float, text: str) -> None:
+        # Loaders may report the same step repeatedly; don't pickle/pipe updates the UI already has
+        nonlocal last_progress
+        update = (progress, text)
+        if update == last_progress:
+            return
+        last_progress = update
         progress_queue.put(("PROGRESS", progress, text))
 
     try:
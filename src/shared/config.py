@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Tuple
 
 from src.shared.mods import load_requested_mods, resolve_project_mods
 
@@ -23,6 +23,10 @@ class GameConfig:
 
         self.dev_mode: bool = True  # Default to True for dev-mode fail-fast testing
 
+        # Session caches for cached_path() and get_asset_path(), keyed by (name, active mod stack)
+        self._resolved_paths: Dict[Tuple[str, Tuple[str, ...]], Path] = {}
+        self._asset_paths: Dict[Tuple[str, Tuple[str, ...]], Path] = {}
+
         # Keep both the user-requested list and the resolved dependency stack.
         # The client needs the same mod order as the server so layered data and
         # assets resolve consistently during startup.
@@ -56,6 +60,20 @@ class GameConfig:
                 dirs.append(mod_data_dir)
         return dirs
 
+    def cached_path(self, name: str, resolve: Callable[[], Path]) -> Path:
+        """
+        Returns the path resolved by `resolve` for `name`. The entry is keyed by the active mod
+        stack, so changing mods re-resolves. Like get_asset_path, only paths that exist are
+        remembered; placeholders for missing files are re-probed so files added later are picked up.
+        """
+        key = (name, tuple(self.active_mods))
+        path = self._resolved_paths.get(key)
+        if path is None:
+            path = resolve()
+            if Path(path).is_file():
+                self._resolved_paths[key] = path
+        return path
+
     def get_write_data_dir(self) -> Path:
         """
         Returns the directory where the Editor should save changes.
@@ -68,9 +86,17 @@ class GameConfig:
     def get_asset_path(self, subpath: str) -> Path:
         """
         Finds an asset (image/sound) by searching through active mods.
+        Found assets are remembered for the session; misses are re-probed so files added
+        later are still picked up.
         """
+        key = (subpath, tuple(self.active_mods))
+        path = self._asset_paths.get(key)
+        if path is not None:
+            return path
+
         for mod_id in reversed(self.active_mods):
             path = self.modules_dir / mod_id / "assets" / subpath
             if path.exists():
+                self._asset_paths[key] = path
                 return path
         return self.modules_dir / "base" / "assets" / subpath
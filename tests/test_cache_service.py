@@ -0,0 +1,86 @@
+import hashlib
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from src.core.cache_service import CacheService
+from src.core.paths import ProjectPaths
+
+
+class CacheServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        with mock.patch.object(ProjectPaths, "cache", return_value=self.tmp):
+            self.cache = CacheService(project_root=self.tmp)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+
+class TestCacheServicePaths(CacheServiceTestCase):
+    def test_path_fingerprint_is_resolved_once(self):
+        source = self.tmp / "terrain.png"
+
+        with mock.patch.object(Path, "resolve", autospec=True, side_effect=lambda p, strict=False: p) as resolve:
+            first = self.cache.get_cache_path(source, ".npy")
+            second = self.cache.get_cache_path(source, "_index.npz")
+
+        self.assertEqual(resolve.call_count, 1)
+        self.assertEqual(first.parent, self.tmp)
+        self.assertEqual(first.stem, second.name[:-len("_index.npz")])
+
+    def test_cache_names_keep_the_md5_path_fingerprint(self):
+        source = self.tmp / "terrain.png"
+        fingerprint = hashlib.md5(str(source.resolve()).encode("utf-8")).hexdigest()[:12]
+
+        self.assertEqual(self.cache.get_cache_path(source, ".npy").name, f"terrain_{fingerprint}.npy")
+
+
+class TestCacheServiceBackgroundSaves(CacheServiceTestCase):
+    def test_queued_saves_are_written_in_order_on_one_thread(self):
+        threads = []
+        original = self.cache._save_numpy_worker
+
+        def recording_worker(path, data):
+            threads.append(threading.current_thread().name)
+            original(path, data)
+
+        self.cache._save_numpy_worker = recording_worker
+        for i in range(3):
+            self.cache.save_numpy_array(self.tmp / f"a{i}.npy", np.full((4, 4), i, dtype=np.uint8))
+        self.cache.close()
+
+        self.assertEqual(set(threads), {"cache-saver"})
+        for i in range(3):
+            np.testing.assert_array_equal(np.load(self.tmp / f"a{i}.npy"), np.full((4, 4), i, dtype=np.uint8))
+        self.assertEqual(list(self.tmp.glob("*.tmp*")), [])
+
+
+class TestCacheServiceLz4(CacheServiceTestCase):
+    def test_round_trip_keeps_shape_dtype_and_writability(self):
+        if not self.cache.lz4_available:
+            self.skipTest("lz4 not installed")
+        data = np.arange(6 * 5 * 4, dtype=np.uint8).reshape(6, 5, 4)
+        path = self.tmp / "terrain.lz4"
+
+        self.cache.save_numpy_lz4(path, data, in_background=False)
+        loaded = self.cache.load_numpy_lz4(path)
+
+        np.testing.assert_array_equal(loaded, data)
+        self.assertEqual(loaded.dtype, data.dtype)
+        self.assertTrue(loaded.flags.writeable)
+
+    def test_missing_metadata_is_a_miss(self):
+        path = self.tmp / "terrain.lz4"
+        path.write_bytes(b"not a frame")
+
+        self.assertIsNone(self.cache.load_numpy_lz4(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
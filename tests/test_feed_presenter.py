@@ -0,0 +1,43 @@
+import unittest
+from unittest import mock
+
+import polars as pl
+
+from src.client.ui.panels.service.feed_presenter import FeedPresenter
+from src.shared.state import GameState
+
+
+def news_table(headline: str) -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "headline": [headline],
+            "body": [""],
+            "related_country_id": ["USA"],
+            "created_at": [1],
+        }
+    )
+
+
+class TestFeedPresenterSummary(unittest.TestCase):
+    def test_summary_is_reused_until_a_source_table_is_replaced(self):
+        state = GameState(tables={"news_items": news_table("First")})
+        presenter = FeedPresenter()
+
+        with mock.patch.object(presenter, "_build_summary", wraps=presenter._build_summary) as build:
+            first = presenter.build_summary(state, "USA")
+            self.assertIs(presenter.build_summary(state, "USA"), first)
+            self.assertEqual(build.call_count, 1)
+
+            presenter.build_summary(state, "CAN")
+            self.assertEqual(build.call_count, 2)
+
+            state.tables["news_items"] = news_table("Second")
+            summary = presenter.build_summary(state, "CAN")
+            self.assertEqual(build.call_count, 3)
+
+        self.assertEqual(first.ticker_text, "First")
+        self.assertEqual(summary.ticker_text, "Second")
+
+
+if __name__ == "__main__":
+    unittest.main()
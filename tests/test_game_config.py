@@ -1,5 +1,6 @@
 import shutil
 import unittest
+from unittest import mock
 from pathlib import Path
 from uuid import uuid4
 
@@ -26,6 +27,62 @@ class TestGameConfig(unittest.TestCase):
         path = self.config.get_asset_path("map/terrain.png")
         self.assertTrue(path.exists())
 
+    def test_cached_path_resolves_once_per_mod_stack(self):
+        work_dir = self.temp_root / f"cached-path-{uuid4().hex}"
+        work_dir.mkdir(parents=True)
+        self.addCleanup(shutil.rmtree, work_dir, ignore_errors=True)
+        calls = []
+
+        def resolve():
+            calls.append(list(self.config.active_mods))
+            path = work_dir / f"{len(calls)}.png"
+            path.write_bytes(b"")
+            return path
+
+        first = self.config.cached_path("test.map", resolve)
+        second = self.config.cached_path("test.map", resolve)
+        self.config.active_mods = self.config.active_mods + ["extra"]
+        third = self.config.cached_path("test.map", resolve)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, third)
+        self.assertEqual(len(calls), 2)
+
+    def test_cached_path_reprobes_missing_placeholders(self):
+        work_dir = self.temp_root / f"cached-path-{uuid4().hex}"
+        work_dir.mkdir(parents=True)
+        self.addCleanup(shutil.rmtree, work_dir, ignore_errors=True)
+        target = work_dir / "terrain.png"
+        placeholder = work_dir / "missing_terrain_placeholder.png"
+
+        def resolve():
+            return target if target.exists() else placeholder
+
+        self.assertEqual(self.config.cached_path("test.terrain", resolve), placeholder)
+        target.write_bytes(b"")
+        self.assertEqual(self.config.cached_path("test.terrain", resolve), target)
+
+    def test_get_asset_path_remembers_hits_but_not_misses(self):
+        project_root = self.temp_root / f"config-test-{uuid4().hex}"
+        project_root.mkdir(parents=True, exist_ok=True)
+        try:
+            self._write_mod(project_root, "base", [])
+            config = GameConfig(project_root)
+            assets = project_root / "modules" / "base" / "assets"
+
+            missing = config.get_asset_path("map/terrain.png")
+            self.assertFalse(missing.exists())
+
+            (assets / "map").mkdir(parents=True)
+            (assets / "map" / "terrain.png").write_bytes(b"")
+            found = config.get_asset_path("map/terrain.png")
+            self.assertTrue(found.exists())
+
+            with mock.patch.object(Path, "exists", side_effect=AssertionError("probed")):
+                self.assertEqual(config.get_asset_path("map/terrain.png"), found)
+        finally:
+            shutil.rmtree(project_root, ignore_errors=True)
+
     def test_resolves_dependency_load_order_from_mods_json(self):
         project_root = self.temp_root / f"config-test-{uuid4().hex}"
         project_root.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,166 @@
+import ctypes
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from imgui_bundle import imgui
+
+from src.client.renderers import imgui_renderer
+from src.client.renderers.imgui_renderer import ProgrammablePipelineRenderer, StagedImGuiRenderer
+
+
+class FakeVector:
+    """Stands in for an ImVector: a ctypes buffer exposing size() and data_address()."""
+
+    def __init__(self, data: bytes, item_size: int):
+        self._buffer = ctypes.create_string_buffer(data, len(data))
+        self._count = len(data) // item_size
+
+    def size(self) -> int:
+        return self._count
+
+    def data_address(self) -> int:
+        return ctypes.addressof(self._buffer)
+
+
+def command_list(vtx_count: int, idx_count: int, fill: int, commands):
+    return SimpleNamespace(
+        vtx_buffer=FakeVector(bytes([fill]) * vtx_count * imgui.VERTEX_SIZE, imgui.VERTEX_SIZE),
+        idx_buffer=FakeVector(bytes([fill]) * idx_count * imgui.INDEX_SIZE, imgui.INDEX_SIZE),
+        cmd_buffer=[
+            SimpleNamespace(
+                tex_ref=SimpleNamespace(get_tex_id=lambda: 1),
+                clip_rect=(0, 0, 10, 10),
+                elem_count=elem_count,
+                idx_offset=idx_offset,
+                vtx_offset=vtx_offset,
+            )
+            for elem_count, idx_offset, vtx_offset in commands
+        ],
+    )
+
+
+class StagedRendererTestCase(unittest.TestCase):
+    def setUp(self):
+        self.gl = mock.MagicMock()
+        self.gl.glClientWaitSync.return_value = self.gl.GL_ALREADY_SIGNALED
+        for target in (
+            mock.patch.object(imgui_renderer, "gl", self.gl),
+            mock.patch.object(imgui_renderer, "get_common_gl_state", return_value=None),
+            mock.patch.object(imgui_renderer, "restore_common_gl_state"),
+            mock.patch.object(ProgrammablePipelineRenderer, "__init__", return_value=None),
+        ):
+            target.start()
+            self.addCleanup(target.stop)
+
+        self.renderer = StagedImGuiRenderer()
+        self.renderer.io = SimpleNamespace(display_size=(100, 50), display_framebuffer_scale=(1, 1))
+        self.renderer._update_textures = mock.Mock()
+        # Device handles the stock backend would create in _create_device_objects
+        for name in ("_shader_handle", "_attrib_location_tex", "_attrib_proj_mtx",
+                     "_vao_handle", "_vbo_handle", "_elements_handle"):
+            setattr(self.renderer, name, 0)
+
+    def render(self, *cmd_lists):
+        draw_data = SimpleNamespace(
+            cmd_lists=list(cmd_lists),
+            total_vtx_count=sum(c.vtx_buffer.size() for c in cmd_lists),
+            total_idx_count=sum(c.idx_buffer.size() for c in cmd_lists),
+            scale_clip_rects=lambda scale: None,
+        )
+        self.gl.glDrawElementsBaseVertex.reset_mock()
+        self.renderer.render(draw_data)
+        return [c.args for c in self.gl.glDrawElementsBaseVertex.call_args_list]
+
+
+class TestStagedRendererRing(StagedRendererTestCase):
+    def test_frames_rotate_through_segments_with_matching_offsets(self):
+        renderer = self.renderer
+        renderer._segment_vtx_bytes = 10 * imgui.VERTEX_SIZE
+        renderer._segment_idx_bytes = 12 * imgui.INDEX_SIZE
+        lists = (command_list(4, 6, 1, [(3, 0, 0), (3, 3, 2)]), command_list(3, 6, 2, [(6, 0, 0)]))
+
+        frames = [self.render(*lists) for _ in range(renderer.SEGMENTS + 1)]
+
+        for frame_number, draws in enumerate(frames):
+            segment = frame_number % renderer.SEGMENTS
+            vtx_base = segment * 10
+            idx_base = segment * 12 * imgui.INDEX_SIZE
+            self.assertEqual([(d[3].value or 0, d[4]) for d in draws], [
+                (idx_base, vtx_base),
+                (idx_base + 3 * imgui.INDEX_SIZE, vtx_base + 2),
+                (idx_base + 6 * imgui.INDEX_SIZE, vtx_base + 4),  # second list starts after the first's 4 vertices
+            ])
+
+    def test_persistent_writes_land_in_the_frame_segment(self):
+        renderer = self.renderer
+        renderer._segment_vtx_bytes = 8 * imgui.VERTEX_SIZE
+        renderer._segment_idx_bytes = 8 * imgui.INDEX_SIZE
+        vtx_ring = ctypes.create_string_buffer(renderer._segment_vtx_bytes * renderer.SEGMENTS)
+        idx_ring = ctypes.create_string_buffer(renderer._segment_idx_bytes * renderer.SEGMENTS)
+        renderer._vtx_ptr = ctypes.addressof(vtx_ring)
+        renderer._idx_ptr = ctypes.addressof(idx_ring)
+
+        self.render(command_list(2, 3, 7, []))
+        self.render(command_list(1, 2, 9, []))
+
+        vtx_seg = renderer._segment_vtx_bytes
+        self.assertEqual(vtx_ring.raw[:2 * imgui.VERTEX_SIZE], bytes([7]) * 2 * imgui.VERTEX_SIZE)
+        self.assertEqual(vtx_ring.raw[vtx_seg:vtx_seg + imgui.VERTEX_SIZE], bytes([9]) * imgui.VERTEX_SIZE)
+        self.assertEqual(idx_ring.raw[renderer._segment_idx_bytes:][:2 * imgui.INDEX_SIZE], bytes([9]) * 2 * imgui.INDEX_SIZE)
+        self.gl.glBufferSubData.assert_not_called()
+
+    def test_capacity_doubles_until_the_frame_fits(self):
+        renderer = self.renderer
+        start = renderer.INITIAL_SEGMENT_BYTES
+
+        with mock.patch.object(renderer, "_allocate_ring") as allocate:
+            renderer._ensure_capacity(start, start)
+            allocate.assert_not_called()
+
+            renderer._ensure_capacity(start * 3, start + 1)
+            self.assertEqual(allocate.call_count, 1)
+
+        self.assertEqual(renderer._segment_vtx_bytes, start * 4)
+        self.assertEqual(renderer._segment_idx_bytes, start * 2)
+
+
+class TestStagedRendererSync(StagedRendererTestCase):
+    def test_fence_wait_retries_after_timeout(self):
+        gl = self.gl
+        gl.glClientWaitSync.side_effect = [gl.GL_TIMEOUT_EXPIRED, gl.GL_TIMEOUT_EXPIRED, gl.GL_CONDITION_SATISFIED]
+        self.renderer._fences[0] = "fence"
+
+        self.renderer._wait_fence(0)
+
+        self.assertEqual(gl.glClientWaitSync.call_count, 3)
+        self.assertEqual(gl.glClientWaitSync.call_args_list[0].args[1], gl.GL_SYNC_FLUSH_COMMANDS_BIT)
+        self.assertEqual(gl.glClientWaitSync.call_args.args[1], 0)
+        gl.glDeleteSync.assert_called_once_with("fence")
+        self.assertIsNone(self.renderer._fences[0])
+
+    def test_failed_fence_wait_drains_the_queue(self):
+        self.gl.glClientWaitSync.return_value = self.gl.GL_WAIT_FAILED
+        self.renderer._fences[1] = "fence"
+
+        self.renderer._wait_fence(1)
+
+        self.gl.glFinish.assert_called_once()
+
+    def test_buffer_storage_is_detected_from_the_context(self):
+        gl = self.gl
+
+        def context(version, extensions=()):
+            values = {gl.GL_MAJOR_VERSION: version[0], gl.GL_MINOR_VERSION: version[1],
+                      gl.GL_NUM_EXTENSIONS: len(extensions)}
+            gl.glGetIntegerv.side_effect = values.__getitem__
+            gl.glGetStringi.side_effect = lambda name, i: extensions[i]
+            return StagedImGuiRenderer._supports_buffer_storage()
+
+        self.assertFalse(context((3, 3), (b"GL_ARB_sync", b"GL_ARB_timer_query")))
+        self.assertTrue(context((3, 3), (b"GL_ARB_sync", b"GL_ARB_buffer_storage")))
+        self.assertTrue(context((4, 6)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import cv2
+import numpy as np
+
+from src.core.cache_service import CacheService
+from src.core.map_data import RegionMapData
+from src.core.paths import ProjectPaths
+
+
+class TestRegionMapDataCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        with mock.patch.object(ProjectPaths, "cache", return_value=self.tmp):
+            self.cache = CacheService(project_root=self.tmp)
+        self.image_path = self.tmp / "regions.png"
+        bgr = np.random.default_rng(0).integers(0, 255, (12, 20, 3), dtype=np.uint8)
+        cv2.imwrite(str(self.image_path), bgr)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_second_load_is_served_from_the_cache(self):
+        built, first_hit = RegionMapData.load_cached(self.image_path, self.cache)
+        self.cache.close()
+
+        with mock.patch("src.core.map_data.cv2.imread") as imread:
+            cached, second_hit = RegionMapData.load_cached(self.image_path, self.cache)
+
+        self.assertFalse(first_hit)
+        self.assertTrue(second_hit)
+        imread.assert_not_called()
+        self.assertEqual((cached.width, cached.height), (20, 12))
+        np.testing.assert_array_equal(cached.packed_map, built.packed_map)
+        self.assertEqual(cached.get_region_id(3, 5), built.get_region_id(3, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
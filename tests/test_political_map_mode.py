@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 
 import polars as pl
 
@@ -25,6 +26,23 @@ class TestPoliticalMapMode(unittest.TestCase):
         self.assertEqual(color_map[1], color_map[2])
         self.assertNotEqual(color_map[1], color_map[3])
 
+    def test_palette_is_only_generated_for_new_tags(self):
+        mode = PoliticalMapMode()
+        first = GameState(tables={"regions": pl.DataFrame({"id": [1, 2], "owner": ["CAN", "USA"]})})
+        second = GameState(tables={"regions": pl.DataFrame({"id": [1, 2, 3], "owner": ["CAN", "USA", "MEX"]})})
+
+        with patch(
+            "src.client.visualization.map_modes.political_mode.generate_political_colors",
+            side_effect=lambda tags: {tag: (len(tag), 0, 0) for tag in tags},
+        ) as generate:
+            mode.calculate_colors(first)
+            mode.calculate_colors(first)
+            color_map = mode.calculate_colors(second)
+
+        generated = [tag for call in generate.call_args_list for tag in call.args[0]]
+        self.assertCountEqual(generated, ["CAN", "USA", "MEX"])
+        self.assertEqual(set(color_map), {1, 2, 3})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.client.shader_registry import ShaderRegistry, _read_sources
+
+
+class TestShaderRegistry(unittest.TestCase):
+    def setUp(self):
+        ShaderRegistry.clear_cache()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.vert = Path(self._tmp.name) / "a.vert"
+        self.frag = Path(self._tmp.name) / "a.frag"
+        self.vert.write_text("void main() {}", encoding="utf-8")
+        self.frag.write_text("// v1", encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+        ShaderRegistry.clear_cache()
+
+    def test_bundle_is_reread_only_when_a_source_changes(self):
+        first = ShaderRegistry.load_bundle(self.vert, self.frag)
+        self.assertEqual(first, {"vertex_shader": "void main() {}", "fragment_shader": "// v1"})
+
+        self.frag.write_text("// v2", encoding="utf-8")
+        stat = self.frag.stat()
+        os.utime(self.frag, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(ShaderRegistry.load_bundle(self.vert, self.frag)["fragment_shader"], "// v2")
+
+    def test_unchanged_sources_come_from_the_cache(self):
+        ShaderRegistry.load_bundle(self.vert, self.frag)
+        bundle = ShaderRegistry.load_bundle(self.vert, self.frag)
+
+        bundle["fragment_shader"] = "mutated"  # callers get their own dict
+
+        self.assertEqual(ShaderRegistry.load_bundle(self.vert, self.frag)["fragment_shader"], "// v1")
+        self.assertEqual(_read_sources.cache_info().misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
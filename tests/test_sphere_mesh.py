@@ -0,0 +1,54 @@
+import unittest
+
+import numpy as np
+
+from src.client.renderers.sphere_mesh import SphereMesh
+
+
+class RecordingContext:
+    """Minimal stand-in for arcade.gl.Context that keeps uploaded buffer bytes."""
+
+    def __init__(self):
+        self.buffers: list[bytes] = []
+
+    def buffer(self, *, data):
+        self.buffers.append(bytes(memoryview(data)))
+        return len(self.buffers) - 1
+
+
+def reference_indices(seg_u: int, seg_v: int) -> list[int]:
+    indices: list[int] = []
+    w = seg_u + 1
+    for j in range(seg_v):
+        for i in range(seg_u):
+            a = j * w + i
+            b = a + 1
+            c = a + w
+            d = c + 1
+            indices += [a, c, b, b, c, d]
+    return indices
+
+
+class TestSphereMesh(unittest.TestCase):
+    def test_index_buffer_matches_quad_winding(self):
+        ctx = RecordingContext()
+        mesh = SphereMesh(ctx, seg_u=8, seg_v=4)
+
+        idx = np.frombuffer(ctx.buffers[mesh.ibo], dtype=np.uint16)
+
+        self.assertEqual(mesh.index_element_size, 2)
+        self.assertEqual(idx.tolist(), reference_indices(8, 4))
+        self.assertEqual(mesh.index_count, 8 * 4 * 6)
+
+    def test_large_meshes_fall_back_to_32_bit_indices(self):
+        ctx = RecordingContext()
+        mesh = SphereMesh(ctx, seg_u=511, seg_v=128)  # 512 * 129 vertices > 65536
+
+        idx = np.frombuffer(ctx.buffers[mesh.ibo], dtype=np.uint32)
+
+        self.assertEqual(mesh.index_element_size, 4)
+        self.assertEqual(int(idx.max()), 512 * 129 - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
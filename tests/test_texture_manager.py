@@ -0,0 +1,187 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.client.renderers import texture_manager
+from src.client.renderers.texture_manager import TextureManager, _TileStreamer, _encode_ids, _mean_color
+
+
+def reference_lut(lut_len: int, real_ids, color_map, selected) -> np.ndarray:
+    """Original per-entry LUT build, kept as the behavioural reference."""
+    real_to_dense = {real_id: i for i, real_id in enumerate(real_ids)}
+    lut = np.zeros((lut_len, 4), dtype=np.uint8)
+    for real_id, color in color_map.items():
+        if real_id in real_to_dense:
+            dense_id = real_to_dense[real_id]
+            if 0 < dense_id < lut_len:
+                base_alpha = color[3] if len(color) > 3 else 200
+                alpha = 255 if dense_id in selected else base_alpha
+                lut[dense_id] = [color[0], color[1], color[2], alpha]
+    return lut
+
+
+class RecordingTexture:
+    """Applies sub-rectangle writes to a host-side image, like glTexSubImage2D."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.image = np.zeros((size, size, 4), dtype=np.uint8)
+        self.viewports = []
+
+    def write(self, data, viewport=None):
+        x, y, w, h = viewport or (0, 0, self.size, self.size)
+        self.viewports.append((x, y, w, h))
+        self.image[y:y + h, x:x + w] = np.frombuffer(memoryview(data).tobytes(), np.uint8).reshape(h, w, 4)
+
+
+class TestTextureManagerLookupTable(unittest.TestCase):
+    def setUp(self):
+        self.real_ids = np.array([0, 7, 19, 300, 4242, 70000], dtype=np.int64)
+        self.manager = TextureManager(ctx=None, cache_service=None, lut_dim=4)
+        self.manager._set_region_ids(self.real_ids)
+
+    def assert_lut_matches(self, color_map, selected=frozenset()):
+        expected = reference_lut(len(self.manager.lut_data), self.real_ids, color_map, selected)
+        np.testing.assert_array_equal(self.manager.lut_data, expected)
+
+    def test_overlay_handles_mixed_rgb_and_rgba_colors(self):
+        color_map = {
+            0: (1, 2, 3),          # dense 0 is reserved and never written
+            7: (10, 20, 30),
+            19: (40, 50, 60, 90),
+            4242: (70, 80, 90),
+            555: (1, 1, 1),        # unknown region
+        }
+
+        self.manager.update_overlay(color_map)
+
+        self.assert_lut_matches(color_map)
+
+    def test_overlay_rebuild_clears_rows_from_previous_overlay(self):
+        self.manager.update_overlay({7: (1, 1, 1), 300: (2, 2, 2), 70000: (3, 3, 3)})
+        color_map = {19: (9, 9, 9, 100)}
+
+        self.manager.update_overlay(color_map)
+
+        self.assert_lut_matches(color_map)
+
+    def test_selection_raises_alpha_of_selected_regions(self):
+        color_map = {7: (10, 20, 30), 19: (40, 50, 60, 90), 300: (5, 5, 5)}
+        self.manager.update_overlay(color_map)
+
+        self.manager.update_selection({1, 3})
+        self.assert_lut_matches(color_map, selected={1, 3})
+
+        self.manager.update_selection({0, 2, 4, 99})  # 0, unpainted 4 and 99 are ignored
+        self.assertEqual(self.manager.lut_data[0, 3], 0)
+        self.assertEqual(self.manager.lut_data[4, 3], 0)
+        self.assertEqual(self.manager.lut_data[2, 3], 255)
+        self.assertEqual(self.manager.lut_data[1, 3], 200)
+        self.assertEqual(self.manager.lut_data[3, 3], 200)
+
+    def test_overlay_with_selection_matches_separate_updates(self):
+        color_map = {7: (10, 20, 30), 19: (40, 50, 60, 90), 300: (5, 5, 5)}
+        self.manager.update_overlay({7: (1, 1, 1)})
+        self.manager.update_selection({1})
+
+        self.manager.update_overlay(color_map, {2, 3})
+
+        self.assert_lut_matches(color_map, selected={2, 3})
+        self.assertEqual(self.manager.prev_multi_select_dense_ids, {1})
+
+    def test_updates_upload_only_changed_rows(self):
+        texture = RecordingTexture(4)
+        self.manager.lookup_texture = texture
+
+        self.manager.update_overlay({7: (1, 1, 1), 300: (2, 2, 2)})    # dense 1, 3 -> row 0
+        self.manager.flush_lut()
+        self.manager.update_overlay({4242: (3, 3, 3), 70000: (4, 4, 4)})  # dense 4, 5 -> row 1
+        self.manager.update_selection({5})
+        self.assertEqual(texture.viewports, [(0, 0, 4, 1)])  # nothing uploaded until the flush
+
+        self.manager.flush_lut()
+        self.manager.flush_lut()
+
+        self.assertEqual(texture.viewports, [(0, 0, 4, 1), (0, 0, 4, 2)])
+        np.testing.assert_array_equal(texture.image.reshape(-1, 4), self.manager.lut_data)
+
+    def test_selection_change_uploads_only_entered_and_exited_rows(self):
+        texture = RecordingTexture(4)
+        self.manager.lookup_texture = texture
+        self.manager.update_overlay({7: (1, 1, 1), 4242: (3, 3, 3), 70000: (4, 4, 4)})  # dense 1, 4, 5
+        self.manager.update_selection({1, 5})
+        self.manager.flush_lut()
+
+        self.manager.update_selection({1, 4})  # 1 stays selected, only row 1 changes
+        self.manager.flush_lut()
+
+        self.assertEqual(texture.viewports[-1], (0, 1, 4, 1))
+        self.assertEqual(self.manager.lut_data[[1, 4, 5], 3].tolist(), [255, 255, 200])
+
+    def test_lookup_dense_ids_drops_unknown_regions(self):
+        dense_ids = self.manager.lookup_dense_ids([300, 5, 7, 70000, 70001])
+
+        self.assertEqual(dense_ids.tolist(), [3, 1, 5])
+
+    def test_lut_is_sized_to_the_region_count(self):
+        manager = TextureManager(ctx=None, cache_service=None)
+        manager._set_region_ids(self.real_ids)
+        manager.update_overlay({7: (1, 2, 3)})
+
+        manager._fit_lut(70)
+
+        self.assertEqual(manager.lut_dim, 16)
+        self.assertEqual(manager.lut_data.shape, (80, 4))  # 5 rows of 16 reach dense ID 69
+        np.testing.assert_array_equal(manager.lut_data[1], [1, 2, 3, 200])
+
+
+class TestEncodeIds(unittest.TestCase):
+    def test_banded_encode_matches_little_endian_bytes(self):
+        ids = np.arange(37 * 11, dtype=np.int64).reshape(37, 11) * 4099
+        flipped = ids[::-1]
+
+        with mock.patch.object(texture_manager, "_ENCODE_BAND_PIXELS", 64), \
+                mock.patch.object(texture_manager.os, "cpu_count", return_value=4):
+            encoded = _encode_ids(flipped)
+
+        self.assertEqual(encoded.shape, (37, 11, 4))
+        self.assertTrue(encoded.flags.c_contiguous)
+        decoded = encoded.astype(np.int64)
+        np.testing.assert_array_equal(decoded[..., 0] | decoded[..., 1] << 8 | decoded[..., 2] << 16, flipped)
+        self.assertFalse(encoded[..., 3].any())
+
+
+class TestMeanColor(unittest.TestCase):
+    def test_mean_of_sampled_grid(self):
+        image = np.zeros((4, 4, 4), dtype=np.uint8)
+        image[::2, ::2] = (10, 20, 30, 255)
+        image[::2, 1::2] = (30, 40, 50, 255)  # skipped by the step-2 grid
+
+        self.assertEqual(_mean_color(image, step=2), (10, 20, 30, 255))
+        self.assertEqual(_mean_color(image, step=1), (10, 15, 20, 128))
+
+
+class TestTileStreamer(unittest.TestCase):
+    def test_tiles_cover_the_image_once_equator_first(self):
+        image = np.arange(10 * 7 * 4, dtype=np.uint8).reshape(10, 7, 4)
+        streamer = _TileStreamer(image, tile_size=3, max_pending=64)
+        streamer.start()
+        streamer.join(timeout=5)
+
+        rebuilt = np.zeros_like(image)
+        rows = []
+        while (item := streamer.tiles.get_nowait()) is not None:
+            x, y, tile = item
+            self.assertTrue(tile.flags.c_contiguous)
+            rebuilt[y:y + tile.shape[0], x:x + tile.shape[1]] += tile
+            rows.append(y)
+
+        np.testing.assert_array_equal(rebuilt, image)
+        self.assertEqual(len(rows), 4 * 3)
+        self.assertEqual(rows[0], 3)   # band 3..5 holds the equator (row 5)
+        self.assertEqual(rows[-1], 9)  # the 1-row polar band comes last
+
+
+if __name__ == "__main__":
+    unittest.main()
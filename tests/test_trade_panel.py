@@ -0,0 +1,57 @@
+import unittest
+from types import SimpleNamespace
+
+import polars as pl
+
+from src.client.ui.panels.trade_panel import TradePanel
+
+
+def reference_options(countries: pl.DataFrame, exclude_tag: str):
+    """Original per-row build, kept as the behavioural reference."""
+    labels = []
+    for row in countries.iter_rows(named=True):
+        tag = str(row.get("id") or "")
+        if not tag or tag == exclude_tag:
+            continue
+        name = row.get("name") or row.get("display_name") or row.get("country_name") or tag
+        labels.append((tag, f"{name} ({tag})"))
+    return sorted(labels, key=lambda item: item[1])
+
+
+class TestTradePanelPartners(unittest.TestCase):
+    def setUp(self):
+        self.panel = TradePanel()
+
+    def options(self, countries: pl.DataFrame, exclude_tag: str):
+        state = SimpleNamespace(tables={"countries": countries}, get_table=lambda name: countries)
+        return self.panel._country_options(state, exclude_tag)
+
+    def test_partner_options_match_row_by_row_build(self):
+        countries = pl.DataFrame(
+            {
+                "id": ["USA", "FRA", "", "DEU", None, "CAN"],
+                "name": ["United States", "", "Ghost", None, "Nobody", "Canada"],
+                "display_name": [None, "France", None, None, None, "Dominion"],
+            }
+        )
+
+        tags, labels = self.options(countries, exclude_tag="USA")
+
+        self.assertEqual(list(zip(tags, labels)), reference_options(countries, "USA"))
+        self.assertEqual(labels, ["Canada (CAN)", "DEU (DEU)", "France (FRA)"])
+
+    def test_options_are_cached_per_table_and_excluded_tag(self):
+        countries = pl.DataFrame({"id": ["USA", "FRA"], "name": ["United States", "France"]})
+
+        first = self.options(countries, exclude_tag="USA")
+        self.assertIs(self.options(countries, exclude_tag="USA")[1], first[1])
+        self.assertEqual(self.options(countries, exclude_tag="FRA")[0], ["USA"])
+
+    def test_missing_table_or_id_column_yields_no_partners(self):
+        self.assertEqual(self.options(pl.DataFrame({"name": ["X"]}), exclude_tag=""), ([], []))
+        state = SimpleNamespace(tables={}, get_table=None)
+        self.assertEqual(self.panel._country_options(state, ""), ([], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import threading
+import unittest
+
+from src.client.controllers.viewport_controller import ViewportController
+from src.client.visualization.map_modes.base_map_mode import BaseMapMode
+from src.shared.state import GameState
+
+
+class RecordingRenderer:
+    def __init__(self):
+        self.overlays = []
+        self.highlights = []
+
+    def set_overlay_style(self, enabled, opacity):
+        pass
+
+    def update_overlay(self, color_map, highlight=None):
+        self.overlays.append(color_map)
+        self.highlights.append(highlight)
+
+
+class StaticNetClient:
+    def get_state(self):
+        return GameState(tables={})
+
+
+class GatedMapMode(BaseMapMode):
+    def __init__(self, color_map):
+        self.color_map = color_map
+        self.release = threading.Event()
+
+    @property
+    def name(self) -> str:
+        return "Gated"
+
+    def calculate_colors(self, state):
+        self.release.wait(timeout=5)
+        return self.color_map
+
+
+class TestViewportControllerMapLayer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = RecordingRenderer()
+        self.controller = ViewportController(
+            cam_ctrl=None,
+            world_camera=None,
+            map_renderer=self.renderer,
+            net_client=StaticNetClient(),
+            on_selection_change=lambda region_id: None,
+        )
+
+    def test_colors_are_applied_on_poll_after_the_worker_finishes(self):
+        mode = GatedMapMode({1: (10, 20, 30)})
+        self.controller.map_modes = {"gated": mode}
+        self.controller.current_mode_key = "gated"
+
+        self.controller.refresh_map_layer()
+        self.controller.poll_pending_updates()
+        self.assertEqual(self.renderer.overlays, [])
+
+        mode.release.set()
+        self.controller._pending_colors.result(timeout=5)
+        self.controller.poll_pending_updates()
+
+        self.assertEqual(self.renderer.overlays, [{1: (10, 20, 30)}])
+
+    def test_only_the_latest_refresh_is_applied(self):
+        first = GatedMapMode({1: (1, 1, 1)})
+        second = GatedMapMode({2: (2, 2, 2)})
+        self.controller.map_modes = {"first": first, "second": second}
+
+        self.controller.current_mode_key = "first"
+        self.controller.refresh_map_layer()
+        self.controller.current_mode_key = "second"
+        self.controller.refresh_map_layer()
+
+        first.release.set()
+        second.release.set()
+        self.controller._pending_colors.result(timeout=5)
+        self.controller.poll_pending_updates()
+
+        self.assertEqual(self.renderer.overlays, [{2: (2, 2, 2)}])
+
+    def test_highlight_is_applied_with_the_colours_it_was_requested_with(self):
+        mode = GatedMapMode({1: (1, 1, 1)})
+        self.controller.map_modes = {"gated": mode}
+        self.controller.current_mode_key = "gated"
+
+        self.controller.refresh_map_layer(highlight=[])
+        self.controller.refresh_map_layer()
+        mode.release.set()
+        self.controller._pending_colors.result(timeout=5)
+        self.controller.poll_pending_updates()
+
+        self.assertEqual(self.renderer.highlights, [[]])
+
+
+if __name__ == "__main__":
+    unittest.main()